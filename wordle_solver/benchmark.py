@@ -0,0 +1,241 @@
+"""
+Benchmarks a solver configuration against every word of a solution list using the offline simulator.
+Games are spread over a process pool and the results are written to JSON so runs can be diffed.
+
+Multi-board games (--boards 4 for Quordle, 8 for Octordle) are played against seeded random sets of secrets,
+written as one "/"-joined secret per game.
+
+Usage:
+    python wordle_solver/benchmark.py --strategy entropy --output bench_entropy.json
+    python wordle_solver/benchmark.py --strategy entropy --boards 4 --limit 1000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from simulator.simulated_wordle_game import SimulatedWordleGame
+from simulator.simulated_multi_wordle_game import SimulatedMultiWordleGame
+from solvers.algo_solver_v1 import algoSolverV1
+from solvers.multi_board_solver import multiBoardSolverV1
+from solvers.feedback_matrix import DEFAULT_ANSWER_LIST_PATH, DEFAULT_GUESS_LIST_PATH, encode_feedback, read_words
+from utils.game_history import GameHistory
+from utils.instrumentation import Metrics, profile_game
+
+# One solver per worker process, created by init_worker
+worker_solver = None
+
+
+def create_solver(config, metrics=None):
+    if config.get("boards", 1) > 1:
+        game = SimulatedMultiWordleGame(
+            allowed_words=read_words(config["guess_list_path"]) + read_words(config["solution_list_path"]),
+            secret_words=read_words(config["solution_list_path"]),
+            num_boards=config["boards"],
+            max_rows=config.get("max_guesses"),
+        )
+        return multiBoardSolverV1(
+            config["word_list_path"],
+            game,
+            strategy=config["strategy"],
+            display=False,
+            learn=False,
+            guess_list_path=config["guess_list_path"],
+            metrics=metrics,
+            priors=config.get("priors", True),
+        )
+    game = SimulatedWordleGame(
+        allowed_words=read_words(config["guess_list_path"]) + read_words(config["solution_list_path"]),
+        secret_words=read_words(config["solution_list_path"]),
+        max_rows=config.get("max_guesses") or 6,
+    )
+    return algoSolverV1(
+        config["word_list_path"],
+        game=game,
+        display=False,
+        learn=False,
+        engine=config["engine"],
+        guess_list_path=config["guess_list_path"],
+        strategy=config["strategy"],
+        decision_tree_path=config["decision_tree_path"],
+        metrics=metrics,
+        priors=config.get("priors", True),
+    )
+
+
+def init_worker(config):
+    global worker_solver
+    worker_solver = create_solver(config)
+
+
+def play_game(secret):
+    """
+    Plays one game against the given secret with the worker's solver.
+    A game that raises is recorded as lost with the error, so one bad game does not abort the benchmark.
+    :return: Dictionary with the guesses, result and decision latencies of the game.
+    """
+    solver = worker_solver
+    game = solver.game
+    solver.reset_state()
+    solver.decision_times = []
+    error = None
+    try:
+        if isinstance(game, SimulatedMultiWordleGame):
+            game.restart(secrets=secret.split("/"))
+            solver.solve(game)
+        else:
+            game.restart(secret=secret)
+            solver.solve(game)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    if isinstance(game, SimulatedMultiWordleGame):
+        guesses = list(game.submitted_words)
+    else:
+        guesses = game.board.words[:len(game.board)]
+    result = {
+        "secret": secret,
+        "won": error is None and game.game_state == "win",
+        "guesses": guesses,
+        "decision_times": solver.decision_times,
+        "played_at": time.time(),
+    }
+    if error is not None:
+        result["error"] = error
+    return result
+
+
+def summarize(games):
+    """
+    Aggregates the per-game results into the benchmark summary.
+    """
+    wins = [game for game in games if game["won"]]
+    histogram = Counter(str(len(game["guesses"])) if game["won"] else "X" for game in games)
+    latencies = np.array([t for game in games for t in game["decision_times"]]) * 1000
+    percentiles = {}
+    if len(latencies):
+        for p in (50, 90, 99):
+            percentiles[f"p{p}"] = float(np.percentile(latencies, p))
+        percentiles["max"] = float(latencies.max())
+    return {
+        "games": len(games),
+        "win_rate": 100 * len(wins) / len(games) if games else 0.0,
+        "mean_guesses": float(np.mean([len(game["guesses"]) for game in wins])) if wins else None,
+        "histogram": dict(sorted(histogram.items())),
+        "fails": sorted(game["secret"] for game in games if not game["won"]),
+        "errors": {game["secret"]: game["error"] for game in games if "error" in game},
+        "decision_latency_ms": percentiles,
+    }
+
+
+def record_history(report, history_path):
+    """
+    Appends every benchmark game to a game history database, multi-board games without their feedback.
+    """
+    history = GameHistory(history_path, batch_size=1000)
+    try:
+        for game in report["games"]:
+            single_board = "/" not in game["secret"]
+            codes = [encode_feedback(guess, game["secret"]) for guess in game["guesses"]] if single_board else ()
+            history.record(game["secret"], game["guesses"], codes, game["won"], strategy=report["config"]["strategy"],
+                           decision_times=game["decision_times"], played_at=game["played_at"])
+    finally:
+        history.close()
+
+
+def run_benchmark(config, workers=None, limit=None):
+    """
+    Plays every solution word once and returns the benchmark report.
+    """
+    secrets = read_words(config["solution_list_path"])
+    boards = config.get("boards", 1)
+    if boards > 1:
+        rng = random.Random(0)
+        secrets = ["/".join(rng.sample(secrets, boards)) for _ in range(len(secrets))]
+    secrets = secrets[:limit]
+    workers = workers or os.cpu_count() or 1
+    # Build (or load) the feedback matrix cache once before the workers memory-map it
+    create_solver(config)
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(config,)) as executor:
+        games = list(executor.map(play_game, secrets, chunksize=max(1, len(secrets) // (workers * 8))))
+    elapsed = time.perf_counter() - start
+    return {
+        "config": config,
+        "workers": workers,
+        "elapsed_seconds": elapsed,
+        "summary": summarize(games),
+        "games": games,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark a Wordle solver against a full solution list.")
+    parser.add_argument("--strategy", default="entropy")
+    parser.add_argument("--engine", default="matrix", choices=["dict", "matrix", "bitset"])
+    parser.add_argument("--word-list", default=DEFAULT_ANSWER_LIST_PATH, help="Word list the solver loads.")
+    parser.add_argument("--solution-list", default=DEFAULT_ANSWER_LIST_PATH, help="Secret words to play against.")
+    parser.add_argument("--guess-list", default=DEFAULT_GUESS_LIST_PATH, help="Words the game accepts as guesses.")
+    parser.add_argument("--decision-tree", default=None, help="Compiled decision tree to play from.")
+    parser.add_argument("--boards", type=int, default=1, help="Simultaneous boards, 4 for Quordle and 8 for Octordle.")
+    parser.add_argument("--max-guesses", type=int, default=None,
+                        help="Guesses allowed per game, defaults to 6 or boards + 5 for multi-board games.")
+    parser.add_argument("--no-priors", action="store_true", help="Treat every word of the word list as equally likely.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes, defaults to the core count.")
+    parser.add_argument("--limit", type=int, default=None, help="Only play the first N solution words.")
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--history", default=None, help="Also record every game into this game history database.")
+    parser.add_argument("--profile", metavar="SECRET", default=None,
+                        help="Only play one game against SECRET (\"/\"-joined for multi-board games) under cProfile and print per-phase timings.")
+    args = parser.parse_args()
+
+    config = {
+        "strategy": args.strategy,
+        "engine": args.engine,
+        "word_list_path": args.word_list,
+        "solution_list_path": args.solution_list,
+        "guess_list_path": args.guess_list,
+        "decision_tree_path": args.decision_tree,
+        "max_guesses": args.max_guesses,
+        "boards": args.boards,
+        "priors": not args.no_priors,
+    }
+    if args.profile:
+        metrics = Metrics()
+        solver = create_solver(config, metrics)
+        solver.reset_state()
+        if args.boards > 1:
+            solver.game.restart(secrets=args.profile.split("/"))
+        else:
+            solver.game.restart(secret=args.profile)
+        profile_game(solver, solver.game)
+        print(json.dumps(metrics.snapshot(), indent=2))
+        return
+
+    report = run_benchmark(config, workers=args.workers, limit=args.limit)
+    with open(args.output, 'w') as file:
+        json.dump(report, file, indent=2)
+    if args.history:
+        record_history(report, args.history)
+
+    summary = report["summary"]
+    print(f"Games: {summary['games']} in {report['elapsed_seconds']:.1f}s with {report['workers']} workers")
+    print(f"Win rate: {summary['win_rate']:.2f}%  Mean guesses: {summary['mean_guesses']}")
+    print(f"Histogram: {summary['histogram']}")
+    print(f"Decision latency (ms): {summary['decision_latency_ms']}")
+    print(f"Fails: {', '.join(summary['fails']) or 'none'}")
+    if summary["errors"]:
+        print(f"Errors: {len(summary['errors'])} games raised, see \"errors\" in {args.output}")
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+import os
+import sys
+import time
+from collections import Counter
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from models.board import Board
+from browser.wordle_game import READ_ROWS_SCRIPT, ROW_SETTLED_SCRIPT, COUNT_TOASTS_SCRIPT, ARM_REVEAL_SCRIPT, ROW_REVEALED_SCRIPT, WIN_RATE_SELECTOR, add_evaluated_row
+
+class AsyncWordleGame:
+    """
+    Async counterpart of WordleGame that plays in its own browser context, so several games can share
+    one Chromium instance under a single asyncio event loop.
+    """
+    def __init__(self, browser, max_rows=6, word_length=5):
+        self.browser = browser
+        self.context = None
+        self.page = None
+        self.board = Board(max_rows, word_length)
+        self.game_state = 'ready'
+        self.reveal_signals = Counter()
+
+    async def start(self):
+        """
+        Opens a new browser context, navigates to the game page and gets a ready to play status.
+        """
+        self.context = await self.browser.new_context()
+        self.page = await self.context.new_page()
+        await self.page.goto("https://wordleunlimited.org/")
+        try:
+            await self.page.add_style_tag(content="""
+                .instructions { display: none !important; }
+            """)
+            await self.page.mouse.click(400, 400)
+            await self.page.wait_for_selector("div#board")
+            self.game_state = 'running'
+        except Exception as e:
+            print(f"Error clicking off the overlay: {e}")
+
+    async def read_rows(self):
+        return await self.page.evaluate(READ_ROWS_SCRIPT)
+
+    async def read_board(self):
+        """
+        Reads only the latest row from the board on the webpage and adds it to the Board object.
+        """
+        add_evaluated_row(self.board, await self.read_rows())
+
+    async def type_word(self, word: str, delay_time: float = 1.8):
+        """
+        Types the specified word into the Wordle game, adds the row if it is accepted and waits for its reveal,
+        see WordleGame.type_word.
+        """
+        row_index = len(self.board)
+        toast_count = await self.page.evaluate(COUNT_TOASTS_SCRIPT)
+        try:
+            await self.page.keyboard.type(word)
+            await self.page.evaluate(ARM_REVEAL_SCRIPT, row_index)
+            await self.page.keyboard.press("Enter")
+        except Exception as e:
+            print(f"Error typing word '{word}': {e}")
+        deadline = time.perf_counter() + delay_time
+        try:
+            await self.page.wait_for_function(ROW_SETTLED_SCRIPT, arg=[row_index, toast_count], timeout=delay_time * 1000)
+        except PlaywrightTimeoutError:
+            pass
+        if add_evaluated_row(self.board, await self.read_rows()):
+            signal = "timeout"
+            remaining = deadline - time.perf_counter()
+            if remaining > 0:
+                try:
+                    handle = await self.page.wait_for_function(ROW_REVEALED_SCRIPT, timeout=remaining * 1000)
+                    signal = await handle.json_value()
+                except PlaywrightTimeoutError:
+                    pass
+            self.reveal_signals[signal] += 1
+        else:
+            for _ in range(len(word)):
+                await self.page.keyboard.press("Backspace")
+
+    async def update_game_state(self):
+        """
+        Updates the game state based on the board, type_word already added the row of an accepted word.
+        """
+        if self.board.won:
+            self.game_state = "win"
+        elif self.board.is_full:
+            self.game_state = "lost"
+        else:
+            self.game_state = "running"
+
+    async def restart(self):
+        """
+        Restarts the game with the page's refresh button.
+        """
+        self.board.reset()
+        await self.page.evaluate("""
+            let overlay = document.querySelector('.fc-dialog-overlay');
+            if (overlay) overlay.remove();
+            let consentRoot = document.querySelector('.fc-consent-root');
+            if (consentRoot) consentRoot.remove();
+        """)
+        await self.page.click("button#refresh-button")
+        await self.page.add_style_tag(content="""
+                .instructions { display: none !important; }
+            """)
+        self.game_state = 'running'
+
+    async def get_answer(self):
+        toast = await self.page.query_selector("game-toast")
+        if toast:
+            return await toast.get_attribute("text")
+        return None
+
+    async def read_win_rate(self, timeout=3000):
+        """
+        Reads the win rate statistic shown after a game, see WordleGame.read_win_rate.
+        """
+        try:
+            statistic = await self.page.wait_for_selector(WIN_RATE_SELECTOR, timeout=timeout)
+        except PlaywrightTimeoutError:
+            return None
+        return await statistic.inner_text() if statistic else None
+
+    async def close(self):
+        if self.context:
+            await self.context.close()
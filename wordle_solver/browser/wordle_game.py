@@ -2,82 +2,204 @@ import os
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
 from models.board import Board
+from collections import Counter
 import time
 
+# querySelectorAll that also descends into open shadow roots, like Playwright's own CSS selectors do
+DEEP_QUERY_ALL = """
+    const deepQueryAll = (root, selector) => {
+        const found = [...root.querySelectorAll(selector)];
+        for (const element of root.querySelectorAll('*')) {
+            if (element.shadowRoot) found.push(...deepQueryAll(element.shadowRoot, selector));
+        }
+        return found;
+    };
+"""
+
+COUNT_TOASTS_SCRIPT = """
+() => {
+""" + DEEP_QUERY_ALL + """    return deepQueryAll(document, 'game-toast').length;
+}
+"""
+
+# Returns every board row as a list of {letter, evaluation} tiles in a single round-trip
+READ_ROWS_SCRIPT = """
+() => {
+""" + DEEP_QUERY_ALL + """    const board = deepQueryAll(document, 'div#board')[0];
+    if (!board) return [];
+    return deepQueryAll(board, 'div.row').map(row => deepQueryAll(row, 'game-tile').map(tile => ({
+        letter: tile.getAttribute('letter'),
+        evaluation: tile.getAttribute('evaluation'),
+    })));
+}
+"""
+
+# Resolves once the given row is fully evaluated or a new toast (invalid word, game over) is shown
+ROW_SETTLED_SCRIPT = """
+([rowIndex, toastCount]) => {
+""" + DEEP_QUERY_ALL + """    if (deepQueryAll(document, 'game-toast').length > toastCount) return true;
+    const board = deepQueryAll(document, 'div#board')[0];
+    if (!board) return false;
+    const row = deepQueryAll(board, 'div.row')[rowIndex];
+    if (!row) return false;
+    const tiles = deepQueryAll(row, 'game-tile');
+    return tiles.length > 0 && tiles.every(tile => tile.getAttribute('evaluation'));
+}
+"""
+
+# Armed between typing a word and submitting it, records when the reveal of that row is over: the
+# game-last-tile-revealed-in-row event the game web components dispatch when they accept input again, or else an
+# animation ending on the last tile of the row once it is evaluated
+ARM_REVEAL_SCRIPT = """
+(rowIndex) => {
+""" + DEEP_QUERY_ALL + """    const reveal = window.__wordleReveal = {revealed: false, tile: null, animationsEnded: 0};
+    document.addEventListener('game-last-tile-revealed-in-row', () => { reveal.revealed = true; }, {once: true});
+    const board = deepQueryAll(document, 'div#board')[0];
+    const row = board && deepQueryAll(board, 'div.row')[rowIndex];
+    const tiles = row ? deepQueryAll(row, 'game-tile') : [];
+    if (!tiles.length) return;
+    reveal.tile = tiles[tiles.length - 1];
+    const onAnimationEnd = () => { if (reveal.tile.getAttribute('evaluation')) reveal.animationsEnded++; };
+    reveal.tile.addEventListener('animationend', onAnimationEnd);
+    if (reveal.tile.shadowRoot) reveal.tile.shadowRoot.addEventListener('animationend', onAnimationEnd);
+}
+"""
+
+# Resolves once the row armed by ARM_REVEAL_SCRIPT is revealed and its last tile has no animation left running,
+# to the name of the signal that ended the wait
+ROW_REVEALED_SCRIPT = """
+() => {
+    const reveal = window.__wordleReveal;
+    if (!reveal) return 'unarmed';
+    if (reveal.revealed) return 'event';
+    if (!reveal.tile || !reveal.animationsEnded) return false;
+    const running = reveal.tile.getAnimations({subtree: true}).some(animation => animation.playState === 'running');
+    return running ? false : 'animation';
+}
+"""
+
+def add_evaluated_row(board, rows):
+    """
+    Adds the next unprocessed row of the page rows to the Board object, once every tile of it is evaluated.
+    :return: True when the row was added.
+    """
+    next_row_index = len(board)
+    if next_row_index >= len(rows) or not WordleGame.row_evaluated(rows[next_row_index]):
+        return False
+    board.add_row([
+        {"row_index": next_row_index, "col_index": col_index, "letter": tile["letter"], "state": tile["evaluation"]}
+        for col_index, tile in enumerate(rows[next_row_index])
+    ])
+    return True
+
+
+# Second statistic of the modal shown after a game
+WIN_RATE_SELECTOR = "div.container div#statistics div.statistic-container div.statistic >> nth=1"
+
+
 class WordleGame:
-    def __init__(self, headless=True):  
-        self.browser = None
+    def __init__(self, headless=True, max_rows=6, word_length=5, browser=None):
+        """
+        :param max_rows: Guesses allowed per game.
+        :param word_length: Letters per word.
+        :param browser: Running Playwright browser to play in, the game then only owns its context.
+            start() launches one when None.
+        """
+        self.browser = browser
+        self.owns_browser = browser is None
+        self.context = None
         self.page = None
-        self.board = Board()
+        self.board = Board(max_rows, word_length)
         self.game_state = 'ready'
         self.headless = headless
         self.playwright = None
+        # Signal that ended the wait for every revealed row: "event", "animation", or "timeout" when none was seen
+        self.reveal_signals = Counter()
 
     def start(self):
         """
-        Starts the Wordle game by launching a browser navigating to the game page and getting a ready to play status.
+        Starts the Wordle game by opening a browser context, navigating to the game page and getting a ready to play status.
+        The browser is launched first if the game has none.
         """
-        self.playwright = sync_playwright().start()
-        self.browser = self.playwright.chromium.launch(headless=self.headless)
-        self.page = self.browser.new_page()
+        if self.browser is None:
+            self.playwright = sync_playwright().start()
+            self.browser = self.playwright.chromium.launch(headless=self.headless)
+        self.context = self.browser.new_context()
+        self.page = self.context.new_page()
         self.page.goto("https://wordleunlimited.org/")
         try:
             self.page.add_style_tag(content="""
                 .instructions { display: none !important; }
             """)
             self.page.mouse.click(400, 400)
-            time.sleep(0.3)
+            self.page.wait_for_selector("div#board")
             self.game_state = 'running'
         except Exception as e:
             print(f"Error clicking off the overlay: {e}")
 
+    def read_rows(self):
+        """
+        Reads every row of the board on the webpage with a single page.evaluate call.
+        :return: List of rows, each a list of {"letter", "evaluation"} dictionaries.
+        """
+        return self.page.evaluate(READ_ROWS_SCRIPT)
+
+    @staticmethod
+    def row_evaluated(row):
+        return bool(row) and all(tile["letter"] and tile["evaluation"] for tile in row)
+
     def read_board(self):
         """
         Reads only the latest row from the board on the webpage and adds it to the Board object.
         """
-        board_div = self.page.query_selector("div#board")
-        if board_div:
-            rows = board_div.query_selector_all("div.row")
-            # Only process the next unprocessed row
-            next_row_index = len(self.board.rows)
-            if next_row_index < len(rows):
-                row = rows[next_row_index]
-                game_tiles = row.query_selector_all("game-tile")
-                row_data = []
-                col_index = 0
-                for tile in game_tiles:
-                    letter = tile.get_attribute("letter")
-                    state = tile.get_attribute("evaluation")
-                    if letter and state:
-                        row_data.append({"row_index": next_row_index, "col_index": col_index, "letter": letter, "state": state})
-                        col_index += 1
-                if row_data:
-                    self.board.add_row(row_data)
+        add_evaluated_row(self.board, self.read_rows())
         
     def type_word(self, word: str, delay_time: float = 1.8):
         """
-        Types the specified word into the Wordle game and submits it.
+        Types the specified word into the Wordle game, submits it and adds the row to the board if the game accepts it.
+        Waits for the row to be evaluated (or a toast to appear), then for its tile reveal animation to end,
+        so the next word is only typed once the game accepts input again. Both waits share delay_time: when no
+        reveal signal is seen the word takes as long as the fixed sleep this replaced, never longer.
 
         Args:
             word (str): The word to type into the game.
-            delay_time (float): The time to wait after typing the word before proceeding.
+            delay_time (float): The maximum time from submitting the word until the next input.
         """
+        row_index = len(self.board)
+        toast_count = self.page.evaluate(COUNT_TOASTS_SCRIPT)
         try:
             self.page.keyboard.type(word)
+            self.page.evaluate(ARM_REVEAL_SCRIPT, row_index)
             self.page.keyboard.press("Enter")
         except Exception as e:
             print(f"Error typing word '{word}': {e}")
-        time.sleep(delay_time)
-        for _ in range(5):
-            self.page.keyboard.press("Backspace")
+        deadline = time.perf_counter() + delay_time
+        try:
+            self.page.wait_for_function(ROW_SETTLED_SCRIPT, arg=[row_index, toast_count], timeout=delay_time * 1000)
+        except PlaywrightTimeoutError:
+            pass
+        if add_evaluated_row(self.board, self.read_rows()):
+            signal = "timeout"
+            remaining = deadline - time.perf_counter()
+            # A timeout of 0 would wait forever
+            if remaining > 0:
+                try:
+                    signal = self.page.wait_for_function(ROW_REVEALED_SCRIPT, timeout=remaining * 1000).json_value()
+                except PlaywrightTimeoutError:
+                    pass
+            self.reveal_signals[signal] += 1
+        else:
+            # The word was refused, clear it from the row
+            for _ in range(len(word)):
+                self.page.keyboard.press("Backspace")
 
     def restart(self):
         """
         Restarts the game by refreshing the page and scrolls to the top.
         """
-        self.board = Board()
+        self.board.reset()
         self.page.evaluate("""
             let overlay = document.querySelector('.fc-dialog-overlay');
             if (overlay) overlay.remove();
@@ -85,31 +207,77 @@ class WordleGame:
             if (consentRoot) consentRoot.remove();
         """)
         self.page.click("button#refresh-button")
+        self.page.add_style_tag(content="""
+                .instructions { display: none !important; }
+            """)
         self.game_state = 'running'
 
+    def get_answer(self):
+        """
+        Reads the correct word from the toast shown after a lost game.
+        :return: The correct word or None if no toast is shown.
+        """
+        toast = self.page.query_selector("game-toast")
+        if toast:
+            return toast.get_attribute("text")
+        return None
+
+    def read_win_rate(self, timeout=3000):
+        """
+        Reads the win rate statistic shown after a game.
+        :param timeout: Milliseconds to wait for the statistics modal, which opens after the last row is revealed.
+        :return: The win rate text or None if it was not shown in time.
+        """
+        try:
+            statistic = self.page.wait_for_selector(WIN_RATE_SELECTOR, timeout=timeout)
+        except PlaywrightTimeoutError:
+            return None
+        return statistic.inner_text() if statistic else None
+
     def update_game_state(self):
         """
-        Updates the game state based on the board and page.
+        Updates the game state based on the board, type_word already added the row of an accepted word.
         """
-        self.read_board()
-        # Check for win: any row where all states are 'correct'
-        for row in self.board.rows:
-            if all(tile.state == "correct" for tile in row):
-                self.game_state = "win"
-                return
+        # Check for win: the last row is all 'correct'
+        if self.board.won:
+            self.game_state = "win"
+            return
 
         # Check for lose: max rows filled and no win
-        if len(self.board.rows) >= self.board.max_rows:
+        if self.board.is_full:
             self.game_state = "lost"
             return
 
         # Otherwise, game is in progress
         self.game_state = "running"
 
+    def recycle(self):
+        """
+        Replaces the game's context and page with fresh ones in the same browser, e.g. after the page failed.
+        """
+        self.close_context()
+        self.board.reset()
+        self.game_state = 'ready'
+        self.start()
+
+    def close_context(self):
+        """
+        Closes the page and context of the game, ignoring errors from ones that already died.
+        """
+        for target in (self.page, self.context):
+            if target is not None:
+                try:
+                    target.close()
+                except Exception:
+                    pass
+        self.page = None
+        self.context = None
+
     def close(self):
         print("Closing the browser...")
-        if self.page:
-            self.page.close()
+        self.close_context()
+        if not self.owns_browser:
+            return
         if self.browser:
             self.browser.close()
         if self.playwright:
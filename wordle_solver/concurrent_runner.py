@@ -0,0 +1,162 @@
+"""
+Plays on wordleunlimited.org from several browser contexts at once.
+One Chromium instance hosts N contexts, each with its own AsyncWordleGame and solver, all driven by a single
+asyncio event loop. Every solver learns into the same WordListJournal, so rejected and missing words from all
+contexts are merged into one word list, and the solvers share one set of refused words, so a word refused in one
+context is not played again by the others.
+
+Usage:
+    python wordle_solver/concurrent_runner.py --contexts 4
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from playwright.async_api import async_playwright
+
+from browser.async_wordle_game import AsyncWordleGame
+from solvers.algo_solver_v1 import algoSolverV1
+from utils.game_history import GameHistory
+from utils.instrumentation import Metrics
+from utils.word_list_journal import WordListJournal
+
+
+async def solve_async(solver: algoSolverV1, game: AsyncWordleGame):
+    """
+    Async version of algoSolverV1.solve: the turns are decided by the same plan_turn / finish_turn / finish_game
+    steps, only the game I/O is awaited.
+    """
+    removed_words = []
+    turns = 0
+    while game.game_state == 'running':
+        turns += 1
+        rows_before = solver.rows_played(game)
+        # Filtering and scoring are CPU bound, a thread keeps them from stalling the other contexts' browser I/O
+        guess = await asyncio.to_thread(solver.plan_turn, game, removed_words, turns)
+        with solver.metrics.timer("typing"):
+            await game.type_word(guess or 'FORCE')
+        with solver.metrics.timer("read_board"):
+            await game.update_game_state()
+        solver.finish_turn(game, guess, rows_before, removed_words)
+    answers = []
+    if game.game_state == 'lost':
+        correct_word = await game.get_answer()
+        answers = [correct_word] if correct_word else []
+    solver.finish_game(game, removed_words, answers)
+
+
+async def play_context(index, browser, word_list_path, journal, refused, stats, games_per_context, strategy,
+                       metrics=None, history=None, max_consecutive_failures=5):
+    """
+    Plays games in one browser context until games_per_context is reached (forever when None).
+    A failed game is counted and the context is replaced, so it never stops the other contexts. The context gives
+    up after max_consecutive_failures failures in a row and raises the last error.
+    """
+    game = AsyncWordleGame(browser)
+    solver = algoSolverV1(word_list_path, game=game, display=False, journal=journal, strategy=strategy,
+                          metrics=metrics, history=history, refused=refused)
+    played = 0
+    failures = 0
+    try:
+        while games_per_context is None or played < games_per_context:
+            try:
+                if game.context is None:
+                    solver.reset_state()
+                    await game.start()
+                    if game.game_state != 'running':
+                        raise Exception("The game page did not load.")
+                await solve_async(solver, game)
+                played += 1
+                failures = 0
+                stats[game.game_state] = stats.get(game.game_state, 0) + 1
+                win_rate = await game.read_win_rate()
+                if win_rate:
+                    solver.win_rate = win_rate
+                else:
+                    print(f"[context {index}] Could not find win rate statistic.")
+                print(f"[context {index}] {game.game_state} in {len(game.board)} guesses, win rate {solver.win_rate} "
+                      f"(total won {stats.get('win', 0)}, lost {stats.get('lost', 0)})")
+                solver.reset_state()
+                await game.restart()
+            except Exception as e:
+                failures += 1
+                stats["failures"] = stats.get("failures", 0) + 1
+                print(f"[context {index}] Error: {e}")
+                if failures >= max_consecutive_failures:
+                    raise
+                await replace_context(game)
+                await asyncio.sleep(min(2 ** (failures - 1), 60))
+    finally:
+        for signal, count in game.reveal_signals.items():
+            stats[f"reveal_{signal}"] = stats.get(f"reveal_{signal}", 0) + count
+        await game.close()
+
+
+async def replace_context(game: AsyncWordleGame):
+    """
+    Closes the context of a failed game, play_context opens a fresh one for the next game.
+    """
+    try:
+        await game.close()
+    except Exception:
+        pass
+    game.context = None
+    game.page = None
+    game.board.reset()
+
+
+async def run(word_list_path, contexts, headless=True, games_per_context=None, strategy="random", metrics=None,
+              history=None):
+    journal = WordListJournal(word_list_path)
+    # Words refused in any context, every solver stops playing them before its next guess
+    refused = set()
+    stats = {}
+    results = []
+    try:
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch(headless=headless)
+            try:
+                # One context giving up must not cancel the games of the others
+                results = await asyncio.gather(*(
+                    play_context(i, browser, word_list_path, journal, refused, stats, games_per_context, strategy, metrics, history)
+                    for i in range(contexts)
+                ), return_exceptions=True)
+            finally:
+                await browser.close()
+    finally:
+        journal.close()
+    for index, result in enumerate(results):
+        if isinstance(result, Exception):
+            print(f"[context {index}] Gave up: {type(result).__name__}: {result}")
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play Wordle Unlimited in several browser contexts concurrently.")
+    parser.add_argument("--word-list", default="wordle_solver/utils/self_creating_list.txt")
+    parser.add_argument("--contexts", type=int, default=4)
+    parser.add_argument("--games", type=int, default=None, help="Games per context, plays forever when omitted.")
+    parser.add_argument("--strategy", default="random")
+    parser.add_argument("--headed", action="store_true")
+    parser.add_argument("--metrics", default=None, help="Export the metrics to this file, Prometheus format if it ends in .prom.")
+    parser.add_argument("--history", default=None, help="Record every game into this game history database.")
+    args = parser.parse_args()
+    metrics = Metrics(export_path=args.metrics,
+                      export_format="prometheus" if args.metrics and args.metrics.endswith(".prom") else "jsonl")
+    history = GameHistory(args.history, batch_size=10, flush_interval=30.0) if args.history else None
+    try:
+        stats = asyncio.run(run(args.word_list, args.contexts, headless=not args.headed, games_per_context=args.games,
+                                strategy=args.strategy, metrics=metrics, history=history))
+    finally:
+        if history is not None:
+            history.close()
+    metrics.export()
+    print(f"Finished: {stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+Rich dashboard for the solver.
+The solver only puts small event tuples on a queue; a background thread folds them into the dashboard state and
+hands one renderable to a rich.live.Live, which redraws the terminal at a capped rate. Rendering therefore never
+runs on the solver's hot path, and SilentDashboard drops every event for high volume runs.
+"""
+
+import queue
+import threading
+from collections import deque
+
+from rich.align import Align
+from rich.console import Group
+from rich.live import Live
+from rich.panel import Panel
+from rich.progress_bar import ProgressBar
+from rich.table import Table
+
+COLOR_MAP = {
+    "correct": "bold white on green3",
+    "present": "bold white on yellow3",
+    "absent": "white on grey23"
+}
+
+STATE_COLORS = {
+    "running": "bold green",
+    "win": "bold green3",
+    "lost": "bold red"
+}
+
+
+def display_board_rich(rows):
+    """
+    :param rows: Board rows as lists of (letter, state) tuples.
+    """
+    table = Table(show_header=False, box=None, expand=False, padding=(0,1))
+    for row in rows:
+        table.add_row(*(f"[{COLOR_MAP.get(state, 'white')}] {letter} [/]" for letter, state in row))
+    return table
+
+
+def display_game_state(game_state):
+    return f"[{STATE_COLORS.get(game_state, 'white')}] Game State: {game_state.upper()} [/]"
+
+
+def display_win_rate(win_rate):
+    win_rate_val = win_rate.split(" ")[0]
+    # Dynamically color winrate: red (low) to green (high)
+    try:
+        win_rate_num = float(win_rate_val)
+    except ValueError:
+        win_rate_num = 0
+    # Calculate color: 0 = red, 100 = green
+    red = int(255 * (1 - win_rate_num / 100))
+    green = int(180 * (win_rate_num / 100) + 75)  # keep green visible at low winrate
+    color_hex = f"#{red:02x}{green:02x}00"
+    return Panel(f"[bold {color_hex}]Winrate: {win_rate_val}%[/]", expand=True)
+
+
+class SilentDashboard:
+    """
+    Dashboard that ignores every event.
+    """
+    enabled = False
+
+    def publish(self, kind, **data):
+        pass
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+
+class SolverDashboard:
+    """
+    Live dashboard fed by solver events:
+        publish("state", rows=..., game_state=..., words_left=..., guesses_left=..., win_conf=..., removed_words=..., win_rate=...)
+        publish("state", boards=(rows, ...), ...) for multi-board games, the boards are shown side by side
+        publish("message", text=...)
+    """
+    enabled = True
+
+    def __init__(self, refresh_per_second=4, max_messages=5):
+        self.refresh_per_second = refresh_per_second
+        self.events = queue.Queue()
+        self.state = {
+            "rows": (),
+            "boards": (),
+            "game_state": "ready",
+            "words_left": 0,
+            "guesses_left": 0,
+            "win_conf": 0.0,
+            "removed_words": (),
+            "win_rate": None,
+        }
+        self.messages = deque(maxlen=max_messages)
+        self.thread = None
+
+    def publish(self, kind, **data):
+        """
+        Queues an event, the only dashboard work done on the solver thread.
+        """
+        if self.thread is None:
+            self.start()
+        self.events.put((kind, data))
+
+    def start(self):
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        if self.thread is not None:
+            self.events.put(None)
+            self.thread.join()
+            self.thread = None
+
+    def _apply(self, event):
+        kind, data = event
+        if kind == "state":
+            self.state.update(data)
+        elif kind == "message":
+            self.messages.append(data["text"])
+
+    def _run(self):
+        with Live(self.render(), refresh_per_second=self.refresh_per_second, transient=False) as live:
+            while True:
+                event = self.events.get()
+                if event is None:
+                    return
+                self._apply(event)
+                # Fold every queued event into the state before rebuilding the renderable once
+                try:
+                    while True:
+                        event = self.events.get_nowait()
+                        if event is None:
+                            live.update(self.render(), refresh=True)
+                            return
+                        self._apply(event)
+                except queue.Empty:
+                    pass
+                live.update(self.render())
+
+    def render(self):
+        state = self.state
+        panels = [Panel(display_game_state(state["game_state"]), expand=True)]
+        if state["win_rate"]:
+            panels.append(display_win_rate(state["win_rate"]))
+        panel_table = Table.grid(expand=False)
+        panel_table.add_row(*panels)
+
+        bar_table = Table.grid(padding=(0, 1))
+        bar_table.add_row(
+            ProgressBar(total=100, completed=state["win_conf"], width=50),
+            f"[bold]{state['win_conf']:.0f}%[/bold]"
+        )
+        parts = [
+            Align.center(panel_table),
+            Align.center(f"Win Confidence with {state['words_left']} words left and {state['guesses_left']} guesses left:"),
+            Align.center(bar_table),
+        ]
+        if state["boards"]:
+            boards_table = Table.grid(padding=(0, 3))
+            boards_table.add_row(*(display_board_rich(rows) for rows in state["boards"]))
+            parts.append(Align.center(boards_table))
+        else:
+            parts.append(Align.center(display_board_rich(state["rows"])))
+        if state["removed_words"]:
+            parts.append(Align.center(Panel(f"Removed words: {', '.join(state['removed_words'])}", expand=False)))
+        if self.messages:
+            parts.append(Align.center(Panel("\n".join(self.messages), expand=False)))
+        return Group(*parts)
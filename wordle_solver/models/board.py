@@ -1,21 +1,88 @@
-from models.tile import Tile
+from models.tile import Tile, code_typecode, states_to_code, code_to_states
+from array import array
 from uuid import uuid4
 
+
 class Board:
-    def __init__(self):
-        self.rows = []
-        self.current_row = 0 
-        self.max_rows = 6 # Later make this dynamic based on the amount of tries allowed
-        self.max_cols = 5 # Later make this dynamic based on the word length
+    """
+    Compact Wordle board. Every row is stored as the guessed word plus one base-3 feedback code
+    (absent = 0, present = 1, correct = 2, position i has weight 3 ** i) in a buffer preallocated for max_rows,
+    so win/loss checks are O(1) and reset() reuses the buffers between games.
+    The code buffer is as wide as the word length needs, see code_typecode.
+    `rows` still exposes the rows as lists of Tile objects for display and compatibility.
+    """
+    def __init__(self, max_rows=6, max_cols=5):
+        """
+        :param max_rows: Number of guesses allowed.
+        :param max_cols: Word length.
+        """
+        self.max_rows = max_rows
+        self.max_cols = max_cols
+        self.words = [None] * self.max_rows
+        self.codes = array(code_typecode(self.max_cols), [0]) * self.max_rows
+        self.row_count = 0
+        self.won = False
+        self.win_code = 3 ** self.max_cols - 1
+        self._rows = None
         self.uuid = uuid4()
 
+    @property
+    def current_row(self):
+        return self.row_count
+
+    def __len__(self):
+        return self.row_count
+
     def add_row(self, row_data):
         """
         Adds a new row to the board.
-        :param row_data: List of Tile objects representing the row.
+        :param row_data: List of tile dictionaries with "letter" and "state" keys, in column order.
+        """
+        word = "".join(tile["letter"].upper() for tile in row_data)
+        self.add_packed_row(word, states_to_code(tile["state"] for tile in row_data))
+
+    def add_packed_row(self, word: str, code: int):
+        """
+        Adds a new row from a guessed word and its feedback code.
+        """
+        if self.row_count >= self.max_rows:
+            raise ValueError(f"Board {self.uuid} already has {self.max_rows} rows.")
+        self.words[self.row_count] = word
+        self.codes[self.row_count] = code
+        self.row_count += 1
+        self.won = code == self.win_code
+        self._rows = None
+
+    @property
+    def is_full(self):
+        return self.row_count >= self.max_rows
+
+    def states(self, row_index):
+        """
+        Decodes the tile states of a row.
+        """
+        return code_to_states(self.codes[row_index], self.max_cols)
+
+    @property
+    def rows(self):
+        """
+        Rows as lists of Tile objects, built on demand and cached until the board changes.
+        """
+        if self._rows is None:
+            self._rows = [
+                [Tile(row_index, col_index, letter, state)
+                 for col_index, (letter, state) in enumerate(zip(self.words[row_index], self.states(row_index)))]
+                for row_index in range(self.row_count)
+            ]
+        return self._rows
+
+    def reset(self):
+        """
+        Clears the board for a new game, reusing its buffers.
         """
-        row = [Tile(tile["row_index"], tile["col_index"], tile["letter"], tile["state"]) for tile in row_data]
-        self.rows.append(row)
+        self.row_count = 0
+        self.won = False
+        self._rows = None
 
     def display(self):
         """
@@ -26,5 +93,3 @@ class Board:
             print(f"Row {row[0].row_index}:")
             print(' '.join(f"{tile.letter}({tile.state})({tile.col_index})" for tile in row))
         print("\n")
-        
-        
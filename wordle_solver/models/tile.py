@@ -1,8 +1,49 @@
+# Tile states as stored in the packed board rows: absent = 0, present = 1, correct = 2
+STATE_CODES = {"absent": 0, "present": 1, "correct": 2}
+CODE_STATES = {code: state for state, code in STATE_CODES.items()}
+
+
+def code_typecode(word_length: int) -> str:
+    """
+    Smallest array typecode holding every feedback code of a word length:
+    bytes up to 5 letters, 16 bits up to 10 letters, 32 bits beyond.
+    """
+    num_codes = 3 ** word_length
+    if num_codes <= 1 << 8:
+        return 'B'
+    if num_codes <= 1 << 16:
+        return 'H'
+    return 'I'
+
+
+def states_to_code(states) -> int:
+    """
+    Converts a sequence of tile states (names or 0/1/2 values) to a feedback code.
+    """
+    code = 0
+    for i, state in enumerate(states):
+        code += STATE_CODES.get(state, state) * 3 ** i
+    return code
+
+
+def code_to_states(code: int, word_length: int = 5) -> list:
+    """
+    Converts a feedback code back to a list of tile state names.
+    """
+    states = []
+    for _ in range(word_length):
+        states.append(CODE_STATES[code % 3])
+        code //= 3
+    return states
+
+
 class Tile:
     """
     Represents a tile in the Wordle game.
     Each tile has a letter and a status indicating its correctness.
     """
+    __slots__ = ("row_index", "col_index", "letter", "state")
+
     def __init__(self, row_index: int, col_index: int, letter: str, state: str):
         self.row_index = row_index
         self.col_index = col_index
@@ -10,4 +51,4 @@ class Tile:
         self.state = state
 
     def __repr__(self):
-        return f"{self.letter} -> status='{self.state}' -> index={self.row_index};{self.col_index}"
\ No newline at end of file
+        return f"{self.letter} -> status='{self.state}' -> index={self.row_index};{self.col_index}"
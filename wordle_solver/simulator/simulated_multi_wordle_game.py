@@ -0,0 +1,123 @@
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+from models.board import Board
+from solvers.feedback_matrix import DEFAULT_GUESS_LIST_PATH, DEFAULT_ANSWER_LIST_PATH, read_words, encode_feedback
+
+class SimulatedMultiWordleGame:
+    """
+    In-process multi-board Wordle (Quordle with 4 boards, Octordle with 8).
+    Every guess is played on all unsolved boards at once, each board has its own secret and Board,
+    and a solved board stops receiving rows. The game is won when every board is solved within max_rows guesses.
+    """
+    def __init__(self, allowed_words=None, secret_words=None, num_boards=4, secrets=None, seed=None, max_rows=None):
+        """
+        :param allowed_words: Words the game accepts, defaults to the allowed guesses plus the solution list.
+        :param secret_words: Words the secrets are drawn from, defaults to the solution list.
+        :param num_boards: Number of simultaneous boards.
+        :param secrets: Fixed secrets for the first game, random distinct secret words are drawn when None.
+        :param seed: Seed for drawing secrets.
+        :param max_rows: Guesses allowed per game, defaults to num_boards + 5 (9 for Quordle, 13 for Octordle).
+        """
+        self.secret_words = [word.upper() for word in secret_words] if secret_words is not None else read_words(DEFAULT_ANSWER_LIST_PATH)
+        if allowed_words is None:
+            allowed_words = read_words(DEFAULT_GUESS_LIST_PATH) + self.secret_words
+        self.allowed_words = set(word.upper() for word in allowed_words)
+        self.random = random.Random(seed)
+        self.num_boards = num_boards
+        self.max_rows = max_rows if max_rows is not None else num_boards + 5
+        word_length = len(self.secret_words[0]) if self.secret_words else 5
+        self.boards = [Board(self.max_rows, word_length) for _ in range(num_boards)]
+        self.game_state = 'ready'
+        self.secrets = [secret.upper() for secret in secrets] if secrets else None
+        self.submitted_words = []
+        self.submitted_rows = [[] for _ in range(num_boards)]
+        self.games_played = 0
+        self.games_won = 0
+
+    @property
+    def guess_count(self):
+        """
+        Number of accepted guesses this game.
+        """
+        return len(self.submitted_words)
+
+    def start(self):
+        """
+        Starts a game with the configured secrets or random ones.
+        """
+        if self.secrets is None:
+            self.secrets = self.random.sample(self.secret_words, self.num_boards)
+        self.game_state = 'running'
+
+    def type_word(self, word: str, delay_time: float = 0):
+        """
+        Submits a guess to every unsolved board. Words outside the allowed list are silently refused.
+        """
+        word = word.upper()
+        if self.game_state != 'running' or self.guess_count >= self.max_rows:
+            return
+        if len(word) != len(self.secrets[0]) or word not in self.allowed_words:
+            return
+        self.submitted_words.append(word)
+        for rows, secret in zip(self.submitted_rows, self.secrets):
+            if not rows or rows[-1][0] != secret:
+                rows.append((word, encode_feedback(word, secret)))
+
+    def read_board(self):
+        """
+        Adds the unprocessed submitted rows to the Board objects.
+        """
+        for board, rows in zip(self.boards, self.submitted_rows):
+            for row in rows[len(board):]:
+                board.add_packed_row(*row)
+
+    def update_game_state(self):
+        """
+        Updates the game state based on the boards.
+        """
+        self.read_board()
+        previous_state = self.game_state
+        if all(board.won for board in self.boards):
+            self.game_state = "win"
+        elif self.guess_count >= self.max_rows:
+            self.game_state = "lost"
+        else:
+            self.game_state = "running"
+        if previous_state == "running" and self.game_state != "running":
+            self.games_played += 1
+            self.games_won += self.game_state == "win"
+
+    def restart(self, secrets=None):
+        """
+        Starts a new game with new secrets.
+        :param secrets: Fixed secrets for the new game, random secret words are drawn when None.
+        """
+        for board in self.boards:
+            board.reset()
+        for rows in self.submitted_rows:
+            rows.clear()
+        self.submitted_words.clear()
+        self.secrets = [secret.upper() for secret in secrets] if secrets else None
+        self.start()
+
+    def get_answers(self):
+        """
+        Returns the secrets of the unsolved boards once the game is over.
+        """
+        if self.game_state in ("win", "lost"):
+            return [secret for board, secret in zip(self.boards, self.secrets) if not board.won]
+        return []
+
+    def read_win_rate(self):
+        """
+        Returns the win rate over the games played, formatted like the site statistic.
+        """
+        if not self.games_played:
+            return None
+        return f"{100 * self.games_won / self.games_played:.0f} %"
+
+    def close(self):
+        pass
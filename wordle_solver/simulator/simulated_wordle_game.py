@@ -0,0 +1,109 @@
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+from models.board import Board
+from solvers.feedback_matrix import DEFAULT_GUESS_LIST_PATH, DEFAULT_ANSWER_LIST_PATH, read_words, encode_feedback
+
+class SimulatedWordleGame:
+    """
+    In-process Wordle game with the same interface as WordleGame.
+    Guesses are scored locally against a secret word, no browser or network is involved.
+    """
+    def __init__(self, allowed_words=None, secret_words=None, secret=None, seed=None, max_rows=6):
+        """
+        :param allowed_words: Words the game accepts, defaults to the allowed guesses plus the solution list.
+        :param secret_words: Words the secret is drawn from, defaults to the solution list.
+        :param secret: Fixed secret for the first game, a random secret word is drawn when None.
+        :param seed: Seed for drawing secrets.
+        :param max_rows: Guesses allowed per game. The word length is the length of the secret words.
+        """
+        self.secret_words = [word.upper() for word in secret_words] if secret_words is not None else read_words(DEFAULT_ANSWER_LIST_PATH)
+        if allowed_words is None:
+            allowed_words = read_words(DEFAULT_GUESS_LIST_PATH) + self.secret_words
+        self.allowed_words = set(word.upper() for word in allowed_words)
+        self.random = random.Random(seed)
+        word_length = len(self.secret_words[0]) if self.secret_words else 5
+        self.board = Board(max_rows, word_length)
+        self.game_state = 'ready'
+        self.secret = secret.upper() if secret else None
+        self.submitted_rows = []
+        self.games_played = 0
+        self.games_won = 0
+
+    def start(self):
+        """
+        Starts a game with the configured secret or a random one.
+        """
+        if self.secret is None:
+            self.secret = self.random.choice(self.secret_words)
+        self.game_state = 'running'
+
+    def type_word(self, word: str, delay_time: float = 0):
+        """
+        Submits a guess. Words outside the allowed list are silently refused, like the site does.
+
+        Args:
+            word (str): The word to submit.
+            delay_time (float): Unused, kept for interface compatibility with WordleGame.
+        """
+        word = word.upper()
+        if self.game_state != 'running' or len(self.submitted_rows) >= self.board.max_rows:
+            return
+        if len(word) != len(self.secret) or word not in self.allowed_words:
+            return
+        self.submitted_rows.append((word, encode_feedback(word, self.secret)))
+
+    def read_board(self):
+        """
+        Adds the next unprocessed submitted row to the Board object.
+        """
+        next_row_index = len(self.board)
+        if next_row_index < len(self.submitted_rows):
+            self.board.add_packed_row(*self.submitted_rows[next_row_index])
+
+    def update_game_state(self):
+        """
+        Updates the game state based on the board.
+        """
+        self.read_board()
+        previous_state = self.game_state
+        if self.board.won:
+            self.game_state = "win"
+        elif self.board.is_full:
+            self.game_state = "lost"
+        else:
+            self.game_state = "running"
+        if previous_state == "running" and self.game_state != "running":
+            self.games_played += 1
+            self.games_won += self.game_state == "win"
+
+    def restart(self, secret=None):
+        """
+        Starts a new game with a new secret.
+        :param secret: Fixed secret for the new game, a random secret word is drawn when None.
+        """
+        self.board.reset()
+        self.submitted_rows.clear()
+        self.secret = secret.upper() if secret else None
+        self.start()
+
+    def get_answer(self):
+        """
+        Returns the secret word once the game is over.
+        """
+        if self.game_state in ("win", "lost"):
+            return self.secret
+        return None
+
+    def read_win_rate(self):
+        """
+        Returns the win rate over the games played, formatted like the site statistic.
+        """
+        if not self.games_played:
+            return None
+        return f"{100 * self.games_won / self.games_played:.0f} %"
+
+    def close(self):
+        pass
@@ -2,205 +2,295 @@
 First solver for Wordle.
 Uses simple logic to filter the word list based on the current board state.
 Simply removes words who would not be valid guesses based on the current board state.
+
+algoSolverV1 drives the game: it types the guesses of a solvers.candidate_solver.CandidateSolver on a browser or
+simulated game, learns the refused and missing words into the word list and renders the dashboard.
 """
 
-import random
 import os
 import sys
-from rich.table import Table
-from rich.console import Console
-from rich.panel import Panel
-from rich.align import Align
-from rich.progress_bar import ProgressBar
-from rich.panel import Panel
 import time
-import pyautogui
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from browser.wordle_game import WordleGame
-import math
+from solvers.candidate_solver import CandidateSolver
+from solvers.feedback_matrix import DEFAULT_GUESS_LIST_PATH
+from utils.word_list_journal import WordListJournal
+from display.solver_dashboard import SolverDashboard, SilentDashboard
+from utils.instrumentation import NULL_METRICS, timed
 
 class algoSolverV1:
-    def __init__(self, word_list_path, headless=True):
+    """
+    Plays whole games (solve) on a browser or simulated game with a CandidateSolver deciding the guesses.
+    """
+
+    def __init__(self, word_list_path, headless=True, engine="dict", guess_list_path=DEFAULT_GUESS_LIST_PATH, strategy="random",
+                 game=None, display=True, learn=True, decision_tree_path=None, journal=None, dashboard=None,
+                 metrics=None, max_guesses=6, priors=True, feedback_matrix=None, history=None, refused=None):
+        """
+        :param engine: Candidate filtering engine, see CandidateSolver.
+        :param strategy: Guess selection strategy, see CandidateSolver.
+        :param game: Game backend to play on (e.g. SimulatedWordleGame), a browser WordleGame when None.
+        :param display: Show the live Rich dashboard, when False every dashboard event is dropped.
+        :param learn: Write rejected and missing words back to the word list file.
+        :param decision_tree_path: Compiled decision tree to play from, see CandidateSolver.
+        :param journal: WordListJournal shared with other solvers, one is opened for the word list when None.
+        :param dashboard: Dashboard receiving the solver events, defaults to a SolverDashboard or a SilentDashboard.
+        :param metrics: utils.instrumentation.Metrics collecting per-phase timings and counters, disabled when None.
+        :param max_guesses: Guesses allowed per game for the browser game created when game is None.
+            The word length is taken from the word list.
+        :param priors: Answer priors of the CandidateSolver, True builds them and False disables them.
+        :param feedback_matrix: Prebuilt FeedbackMatrix of the guess list against the word list, built from the
+            files when None.
+        :param history: utils.game_history.GameHistory every game played by solve() is recorded into
+            (single board games only), nothing is recorded when None.
+        :param refused: Set of refused words shared with other solvers, see CandidateSolver.
+        """
         self.word_list_path = word_list_path
-        self.word_list = self.load_word_list()
-        self.word_list_length = len(self.word_list)
+        self.learn = learn
+        # Learned words go to an append-only journal, opening it folds earlier journals into the word list file
+        if journal is None and learn:
+            journal = WordListJournal(word_list_path)
+        self.journal = journal
+        self.metrics = metrics if metrics is not None else NULL_METRICS
+        self.solver = CandidateSolver(word_list_path, feedback_matrix=feedback_matrix, engine=engine, strategy=strategy,
+                                      guess_list_path=guess_list_path, decision_tree_path=decision_tree_path,
+                                      priors=priors, max_guesses=max_guesses, metrics=self.metrics, refused=refused)
         self.headless = headless
-        self.game = WordleGame(headless=self.headless)
-        self.absent = []
-        self.present = {}
-        self.correct = {}
+        self.game = game if game is not None else WordleGame(headless=self.headless, max_rows=max_guesses, word_length=self.solver.word_length)
+        board = getattr(self.game, "board", None)
+        self.max_guesses = board.max_rows if board is not None else self.game.max_rows
+        self.solver.max_guesses = self.max_guesses
+        self.display = display
+        if dashboard is None:
+            dashboard = SolverDashboard() if display else SilentDashboard()
+        self.dashboard = dashboard
+        if self.solver.decision_tree_stale:
+            message = f"Warning: {decision_tree_path} was compiled for other word lists, recompile it to play optimally."
+            if self.dashboard.enabled:
+                self.log(message)
+            else:
+                print(message)
+        # Seconds from the start of each turn until the guess is chosen, read by the benchmark
+        self.decision_times = []
+        self.game_decision_times = []
+        self.history = history
+        self.turn_start = time.perf_counter()
         self.win_rate = None
+        self.strategy_name = strategy
+
+    @timed("update_letters")
+    def update_letters(self, game: WordleGame):
+        # Observe every new row of the board
+        board = game.board
+        for row_index in range(self.solver.rows_seen, len(board)):
+            self.solver.observe(board.words[row_index], board.codes[row_index])
 
 
-    def load_word_list(self):
+    def log(self, message):
         """
-        Loads the word list from the specified file.
-        :return: List of words.
+        Sends a message to the dashboard.
         """
-        with open(self.word_list_path, 'r') as file:
-            words = [line.strip().upper() for line in file.readlines()]
-        return words
+        self.dashboard.publish("message", text=message)
+
+
+    def choose_guess(self, win_conf = 0):
+        """
+        Asks the solver for the next guess without typing it and records the decision time.
+        :return: The chosen word.
+        """
+        guess = self.solver.choose_guess(win_conf)
+        decision_time = time.perf_counter() - self.turn_start
+        self.decision_times.append(decision_time)
+        self.game_decision_times.append(decision_time)
+        self.log(f"Guessing: {guess}")
+        return guess
+
+
+    def reject(self, guess):
+        """
+        Tells the solver the game refused a guess and removes it from the word list file.
+        """
+        self.solver.reject(guess)
+        self.remove_from_word_list(guess.lower())
 
-    def update_letters(self, game: WordleGame):
-        if len(game.board.rows) > 0:
-            last_row = game.board.rows[-1]
-            for tile in last_row:
-                if tile.state == 'present':
-                    self.present[tile.letter] = tile.col_index
-                elif tile.state == 'correct':
-                    self.correct[tile.letter] = tile.col_index
-                elif tile.state == 'absent' and tile.letter not in self.present and tile.letter not in self.correct:
-                    self.absent.append(tile.letter)
-        else:
-            pass
-    
-
-    def make_guess(self, game: WordleGame, win_conf = 0):
-        """
-        Makes a guess in the Wordle game based on the current board state.
-        :param game: The WordleGame object.
-        """
-        # The 3 first guesses are preset:
-        # preset_guesses = ['SLATE', 'BRICK', 'JUMPY', 'VOZHD', 'FUNGI', 'WRECK']
-        # preset_guesses = ['BANGS', 'CHORD', 'VEXIL', 'JUMPY', 'TWERK', 'FUNGI']
-        # preset_guesses = ['JUMPY', 'VEXIL', 'CHORD', 'BANGS']
-        # preset_guesses = ['HATES', 'ROUND', 'CLIMB']
-        preset_guesses = ['FRAUD', 'MELON', 'SIGHT', 'CLIMB', 'VOZHD']
-        # preset_guesses = ['CONES', 'TRIAL']
-        # preset_guesses = ['TALES']
-        # preset_guesses = []
-        global guess
-        if len(game.board.rows) < len(preset_guesses) and win_conf < 100:
-            guess = preset_guesses[len(game.board.rows)]
-        else:
-            guess = random.choice(self.word_list)
-        console.print(Align.center(Panel(f"Guessing: {guess}", expand=False)))
-        if guess in self.word_list:
-            self.word_list.remove(guess)
-        game.type_word(guess)
-        
 
     def solve(self, game: WordleGame):
         """
         Solves the Wordle game by making guesses based on the current board state.
         """
-        iteration = 0
-        true_iteration = 0
         removed_words = []
+        turns = 0
         while game.game_state == 'running':
-            true_iteration += 1
-            if true_iteration > 20:
-                console.print(Align.center(Panel("Too many iterations. Raising an error.")))
-                raise Exception("Too many iterations. The game is stuck.")
-            self.update_letters(game)
-            self.filter_word_list()
-            win_conf = display_solver_state(game.board, game.game_state, self.word_list, self.word_list_length, removed_words, self.win_rate)
-            
-            if self.word_list:
-                self.make_guess(game, win_conf=win_conf)
-            else:
-                console.print(Align.center(Panel("No valid words found. Forcing a loss.")))
-                game.type_word('FORCE')
-            
+            turns += 1
+            rows_before = self.rows_played(game)
+            guess = self.plan_turn(game, removed_words, turns)
+            with self.metrics.timer("typing"):
+                game.type_word(guess or 'FORCE')
             # After each guess, read the board and update the game state.
-            game.read_board()
-            game.update_game_state()
-
-            # Check if the word went through or not
-            if game.game_state == 'running':
-                iteration += 1
-                if len(game.board.rows) < iteration:
-                    self.remove_from_word_list(guess.lower())
-                    removed_words.append(guess.lower())
-                    iteration -= 1
-            
-        if game.game_state == 'win':
-            display_solver_state(game.board, game.game_state, self.word_list, self.word_list_length, removed_words, self.win_rate)
-        
-        elif game.game_state == 'lost':
-            display_solver_state(game.board, game.game_state, self.word_list, self.word_list_length, removed_words, self.win_rate)
-            # If the game is lost, retrieve the correct word from the game.
-            toast = game.page.query_selector("game-toast")
-            if toast:
-                correct_word = toast.get_attribute("text")
-                self.add_to_word_list(correct_word.lower())
-            else:
-                correct_word = None
+            with self.metrics.timer("read_board"):
+                game.update_game_state()
+            self.finish_turn(game, guess, rows_before, removed_words)
+        self.finish_game(game, removed_words, self.lost_answers(game))
+
+
+    def plan_turn(self, game, removed_words, turns):
+        """
+        Observes the new rows and chooses the guess of one turn, shared by solve() and the async runner.
+        :param turns: Turns played so far in this game, including this one. Refused guesses do not use a row,
+            so a game stuck on refusals is stopped after 4 turns per allowed guess.
+        :return: The guess to type, None when no candidate is left and 'FORCE' should be typed to lose the game.
+        """
+        if turns > 4 * self.max_guesses:
+            self.log("Too many iterations. Raising an error.")
+            raise Exception("Too many iterations. The game is stuck.")
+        self.turn_start = time.perf_counter()
+        self.update_letters(game)
+        self.solver.filter_word_list()
+        self.metrics.observe("candidates", len(self.solver.candidates))
+        win_conf = self.show_state(game, removed_words)
+        if not len(self.solver.candidates):
+            self.log("No valid words found. Forcing a loss.")
+            return None
+        with self.metrics.timer("guess_selection"):
+            return self.choose_guess(win_conf)
+
+
+    def finish_turn(self, game, guess, rows_before, removed_words):
+        """
+        Checks whether the game accepted the guess once the board is read, a guess that did not add a row was refused.
+        """
+        if game.game_state != 'running' or self.rows_played(game) > rows_before:
+            return
+        self.metrics.count("rejected_words")
+        if guess is not None:
+            self.reject(guess)
+            removed_words.append(guess.lower())
+        elif not len(self.solver.candidates):
+            raise Exception("No candidates left and the forced guess was refused.")
 
 
-    def filter_word_list(self):
+    def finish_game(self, game, removed_words, answers=()):
         """
-        Filters the word list based on the current board state.
-        :return: List of valid words.
+        Renders the final board, learns the answers the game revealed and records the game.
+        :param answers: Answers revealed by a lost game.
         """
-        # Remove all words that contain letters in the 'absent' list
-        # Do not remove the letters that are in the 'present' or 'correct' dictionaries
-        for letter in set(self.absent):
-            if letter not in self.correct and letter not in self.present:
-                self.word_list = [word for word in self.word_list if letter not in word]
+        self.update_letters(game)
+        self.metrics.count("games")
+        self.metrics.count(game.game_state)
+        self.metrics.observe("guesses", self.rows_played(game))
+        self.show_state(game, removed_words)
+        for correct_word in answers:
+            self.add_to_word_list(correct_word.lower())
+            self.learn_answer(correct_word)
+        self.record_history(game, removed_words, answers)
+        self.metrics.maybe_export()
 
-        # Remove all words that do not contain letters in the 'present' dictionary
-        for letter, col_index in self.present.items():
-            self.word_list = [word for word in self.word_list if letter in word and word[col_index] != letter]
 
-        # Remove all words that do not contain letters in the 'correct' dictionary
-        for letter, col_index in self.correct.items():
-            self.word_list = [word for word in self.word_list if word[col_index] == letter]
+    def rows_played(self, game):
+        return len(game.board)
+
+
+    def lost_answers(self, game):
+        """
+        Answer revealed by a lost game, retrieved from the game.
+        """
+        if game.game_state != 'lost':
+            return []
+        correct_word = game.get_answer()
+        return [correct_word] if correct_word else []
+
+
+    def record_history(self, game, removed_words, answers):
+        if self.history is None:
+            return
+        board = game.board
+        if game.game_state == 'win':
+            correct_word = board.words[len(board) - 1]
+        else:
+            correct_word = answers[0] if answers else None
+        self.history.record(correct_word, board.words[:len(board)], board.codes[:len(board)], game.game_state == 'win',
+                            strategy=self.strategy_name, decision_times=self.game_decision_times, rejected=removed_words)
+
+
+    @timed("render")
+    def show_state(self, game: WordleGame, removed_words):
+        """
+        Sends a snapshot of the solver state to the dashboard.
+        :return: The win confidence.
+        """
+        guesses_left = game.board.max_rows - len(game.board)
+        win_conf = self.solver.win_confidence(guesses_left)
+        if self.dashboard.enabled:
+            self.dashboard.publish(
+                "state",
+                rows=tuple(tuple((tile.letter, tile.state) for tile in row) for row in game.board.rows),
+                game_state=game.game_state,
+                words_left=len(self.solver.candidates),
+                guesses_left=guesses_left,
+                win_conf=win_conf,
+                removed_words=tuple(removed_words),
+                win_rate=self.win_rate,
+            )
+        return win_conf
 
 
     def add_to_word_list(self, word):
         """
         Improves the word list file by adding words that are valid guesses if they arent already there.
         """
-        with open(self.word_list_path, 'r') as file:
-            lines = file.readlines()
-            if word + '\n' not in lines:
-                with open(self.word_list_path, 'a') as file:
-                    file.write(word + '\n')
-                    console.print(Align.center(Panel(f"Added {word} to the word list.")))
-            else:
-                console.print(Align.center(Panel(f"{word} is already in the word list.")))
-        
-        
+        if not self.learn:
+            return
+        # The word joins the candidates when the word list is next loaded, the indices stay fixed until then
+        if self.journal.add(word):
+            self.log(f"Added {word} to the word list.")
+        else:
+            self.log(f"{word} is already in the word list.")
+
+
+    def learn_answer(self, word):
+        """
+        Records a word revealed as an answer so its prior goes up for the next games.
+        """
+        if self.learn and self.solver.priors is not None:
+            self.journal.add_answer(word)
+        self.solver.learn_answer(word)
+
+
     def remove_from_word_list(self, word):
         """
         Improves the word list file by removing words that are not valid guesses.
         """
-        with open(self.word_list_path, 'r') as file:
-            lines = file.readlines()
-        with open(self.word_list_path, 'w') as file:
-            for line in lines:
-                if line.strip() != word:
-                    file.write(line)
-        console.print(Align.center(Panel(f"Removed {word} from the word list.")))
+        if not self.learn:
+            return
+        if not self.journal.remove(word):
+            return
+        self.log(f"Removed {word} from the word list.")
 
 
+    @timed("restart")
     def restart_game(self, game: WordleGame):
         """
         Restarts the game.
         """
-        game.page.wait_for_selector("div#statistics", timeout=5000)
-        stat_elements = game.page.query_selector_all("div.container div#statistics div.statistic-container div.statistic")
-        if stat_elements and len(stat_elements) > 1:
-            self.win_rate = stat_elements[1].inner_text()
+        win_rate = game.read_win_rate()
+        if win_rate:
+            self.win_rate = win_rate
         else:
-            print("Could not find win rate statistic.")
-        self.absent = []
-        self.present = {}
-        self.correct = {}
-        self.word_list = self.load_word_list()
+            self.log("Could not find win rate statistic.")
+        self.reset_state()
         game.restart()
-        game.page.add_style_tag(content="""
-                .instructions { display: none !important; }
-            """)
-        # To keep the pc awake
-        console.clear()
-        print("Pressing Shift to keep the PC awake.")
-        pyautogui.keyDown('shift')
-        pyautogui.keyUp('shift')
-        
+        self.metrics.count("restarts")
+
+
+    def reset_state(self):
+        """
+        Resets the solver for a new game.
+        """
+        self.game_decision_times = []
+        self.solver.reset()
+
 
     def start(self):
         """
@@ -212,97 +302,26 @@ class algoSolverV1:
             self.restart_game(self.game)
 
 
-def display_solver_state(board, game_state, word_list, word_list_length, removed_words, win_rate):
-    global console
-    console = Console()
-    console.clear()
-    table = display_board_rich(board)
-    guesses_left = board.max_rows - len(board.rows)
-    win_conf = get_win_confidence(word_list, word_list_length, guesses_left)
-    state_str = display_game_state(game_state)
-
-    # Display game state and winrate side by side
-    panels = [Panel(state_str, expand=True)]
-    if win_rate:
-        win_rate_val = win_rate.split(" ")[0]
-        # Dynamically color winrate: red (low) to green (high)
-        try:
-            win_rate_num = float(win_rate_val)
-        except ValueError:
-            win_rate_num = 0
-        # Calculate color: 0 = red, 100 = green
-        red = int(255 * (1 - win_rate_num / 100))
-        green = int(180 * (win_rate_num / 100) + 75)  # keep green visible at low winrate
-        color_hex = f"#{red:02x}{green:02x}00"
-        panels.append(Panel(f"[bold {color_hex}]Winrate: {win_rate_val}%[/]", expand=True))
-    if len(panels) == 2:
-        panel_table = Table.grid(expand=False)
-        panel_table.add_row(*panels)
-        console.print(Align.center(panel_table))
-    else:
-        console.print(Align.center(panels[0]))
-    console.print(Align.center(f"Win Confidence with {len(word_list)} words left and {guesses_left} guesses left:"))
-    bar_table = Table.grid(padding=(0, 1))
-    bar_table.add_row(
-        ProgressBar(total=100, completed=win_conf, width=50),
-        f"[bold]{win_conf:.0f}%[/bold]"
-    )
-    console.print(Align.center(bar_table))
-    console.print(Align.center(table))
-    if removed_words:
-        console.print(Align.center(Panel(f"Removed words: {', '.join(removed_words)}", expand=False)))
-
-    return win_conf
-
-def display_board_rich(board):
-    table = Table(show_header=False, box=None, expand=False, padding=(0,1))
-    color_map = {
-        "correct": "bold white on green3",
-        "present": "bold white on yellow3",
-        "absent": "white on grey23"
-    }
-    for row in board.rows:
-        row_cells = []
-        for tile in row:
-            style = color_map.get(tile.state, "white")
-            row_cells.append(f"[{style}] {tile.letter} [/]")
-        table.add_row(*row_cells)
-    return table
-
-def get_win_confidence(word_list, word_list_length, guesses_left):
-    words_left = max(len(word_list), 1)
-    if words_left == 1:
-        return 100.0
-    if guesses_left < words_left:
-        # Estimate win confidence based on the probability of guessing the correct word in the remaining guesses
-        prob = 1 - ((words_left - 1) / words_left) ** guesses_left
-        return round(prob * 100, 2)
-    return 100.0
-
-def display_game_state(game_state):
-    state_colors = {
-        "running": "bold green",
-        "win": "bold green3",
-        "lost": "bold red"
-    }
-    state_str = f"[{state_colors.get(game_state, 'white')}] Game State: {game_state.upper()} [/]"
-    return state_str
+    def close(self):
+        """
+        Compacts the learning journal into the word list file, writes the pending history and closes the game.
+        """
+        if self.journal is not None:
+            self.journal.close()
+        if self.history is not None:
+            self.history.flush()
+        self.dashboard.stop()
+        self.metrics.export()
+        if getattr(self.game, "browser", None):
+            self.game.close()
+
 
 if __name__ == "__main__":
-    
+    from supervisor import Supervisor
+
     word_list_path = "wordle_solver/utils/self_creating_list.txt"
     # word_list_path = "wordle_solver/utils/all_en_5_letter_words.txt"
     # word_list_path = "wordle_solver/utils/all_5_letter_words.txt"
     # word_list_path = "wordle_solver/utils/wordle_allowed_guesses.txt"
     # word_list_path = "wordle_solver/utils/wordle_unlimited_solutionlist.txt"
-    while True:
-        try:
-            solver = algoSolverV1(word_list_path, headless=True)
-            solver.start()
-        except Exception as e:
-            if "Target page, context or browser has been closed" in str(e):
-                sys.exit("You closed the game window. Exiting with no game restart...")
-            print(f"Error: {e}")
-            if solver.game.browser:
-                solver.game.close()
-            print("Restarting the game...")
\ No newline at end of file
+    Supervisor(word_list_path, headless=True, display=True).run()
@@ -0,0 +1,62 @@
+"""
+Solver plug-in interface.
+A solver only decides: it is told the feedback of every guess through observe() and asked for the next guess with
+next_guess(), the game (browser, simulator) is driven by whoever owns it. solvers.candidate_solver.CandidateSolver
+is one implementation (the one algoSolverV1 plays with), the tournament runner (tournament.py) plays any number of
+them side by side.
+
+Solvers outside this package are loaded from a "module:ClassName" spec, see load_solver_class.
+"""
+
+import importlib
+
+
+class Solver:
+    """
+    Base class for single board solvers.
+    Feedback is the base-3 code of solvers.feedback_matrix (absent = 0, present = 1, correct = 2, position i has
+    weight 3 ** i), as stored by Board.codes.
+
+    Plug-in solvers are constructed as SolverClass(word_list_path, feedback_matrix=feedback_matrix): the word list
+    the answers are drawn from and the solvers.feedback_matrix.FeedbackMatrix of the guess list against it, shared
+    read-only by every solver of a process. Solvers that do not use the matrix ignore it, every other constructor
+    argument must have a default.
+    """
+    name = "base"
+
+    def reset(self):
+        """
+        Forgets the current game, called before every game.
+        """
+        raise NotImplementedError
+
+    def observe(self, guess: str, feedback: int):
+        """
+        Records the feedback code of an accepted guess.
+        """
+        raise NotImplementedError
+
+    def next_guess(self):
+        """
+        :return: The next word to play, or None when no candidate is left.
+        """
+        raise NotImplementedError
+
+    def reject(self, guess: str):
+        """
+        Called when the game refused the last guess, no row was played and next_guess() is asked again.
+        Solvers that can play such a word again should remember it, the default ignores it.
+        """
+
+
+def load_solver_class(spec: str):
+    """
+    Imports a Solver subclass from a "module:ClassName" spec, e.g. "my_solvers.greedy:GreedySolver".
+    """
+    module_name, _, class_name = spec.partition(":")
+    if not class_name:
+        raise ValueError(f"Solver spec '{spec}' must look like 'module:ClassName'")
+    solver_class = getattr(importlib.import_module(module_name), class_name)
+    if not (isinstance(solver_class, type) and issubclass(solver_class, Solver)):
+        raise ValueError(f"{spec} is not a Solver subclass")
+    return solver_class
@@ -0,0 +1,73 @@
+"""
+Bitset candidate index.
+Precomputes one bitset per (position, letter) and per (letter, minimum count) over a word list, stored as
+Python integers where bit i stands for word i. Applying a row of feedback is then a handful of AND / AND NOT
+operations instead of a scan of the whole list, which keeps filtering fast on very large lists.
+"""
+
+import numpy as np
+
+from solvers.feedback_matrix import words_to_array
+
+
+def to_bitset(flags: np.ndarray) -> int:
+    """
+    Packs a boolean array into an integer bitset, element i becomes bit i.
+    """
+    return int.from_bytes(np.packbits(flags, bitorder='little').tobytes(), 'little')
+
+
+class CandidateIndex:
+    def __init__(self, words, letters=None):
+        """
+        :param words: Word list to index.
+        :param letters: Optional precomputed (len(words), word_length) letter index array, e.g. a packed word list.
+        """
+        self.words = words
+        letters = words_to_array(words) if letters is None else np.asarray(letters)
+        self.word_length = letters.shape[1] if len(words) else 5
+        self.all_bits = (1 << len(words)) - 1
+        # position_bits[i][letter]: words with the letter at position i
+        self.position_bits = [
+            [to_bitset(letters[:, i] == letter) for letter in range(26)]
+            for i in range(self.word_length)
+        ]
+        # count_bits[letter][k]: words containing the letter at least k times (k = 1..word_length)
+        self.count_bits = []
+        for letter in range(26):
+            counts = (letters == letter).sum(axis=1)
+            self.count_bits.append([self.all_bits] + [to_bitset(counts >= k) for k in range(1, self.word_length + 1)])
+
+    def apply_feedback(self, mask: int, guess: str, states) -> int:
+        """
+        Narrows a candidate mask with one row of feedback, handling repeated letters:
+        correct/present tiles give a minimum letter count and an absent tile caps it at that minimum.
+        """
+        known = {}
+        capped = set()
+        for i, (char, state) in enumerate(zip(guess, states)):
+            letter = ord(char) - ord("A")
+            if state == "correct":
+                mask &= self.position_bits[i][letter]
+            else:
+                mask &= ~self.position_bits[i][letter]
+            if state == "absent":
+                capped.add(letter)
+            else:
+                known[letter] = known.get(letter, 0) + 1
+        for letter, count in known.items():
+            mask &= self.count_bits[letter][count]
+        for letter in capped:
+            count = known.get(letter, 0)
+            if count < self.word_length:
+                mask &= ~self.count_bits[letter][count + 1]
+        return mask
+
+    def indices(self, mask: int) -> np.ndarray:
+        """
+        Returns the word indices whose bit is set in the mask.
+        """
+        if not mask:
+            return np.zeros(0, dtype=np.int64)
+        raw = np.frombuffer(mask.to_bytes((mask.bit_length() + 7) // 8, 'little'), dtype=np.uint8)
+        return np.flatnonzero(np.unpackbits(raw, bitorder='little'))
@@ -0,0 +1,331 @@
+"""
+Decision logic of algoSolverV1 as a plug-in Solver.
+Keeps the candidates of the current game as indices into the word list (or the feedback matrix answers), filters
+them with the dict, matrix or bitset engine and chooses guesses with a strategy, a decision tree or the preset
+openers. It never touches a game, a file or the dashboard: algoSolverV1 drives it on a browser or simulated game,
+the tournament runner drives it directly.
+"""
+
+import os
+import random
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from solvers.base_solver import Solver
+from models.tile import code_to_states
+from solvers.feedback_matrix import FeedbackMatrix, DEFAULT_GUESS_LIST_PATH
+from solvers.candidate_index import CandidateIndex
+from solvers.strategies import get_strategy
+from solvers.decision_tree import DecisionTree
+from solvers.priors import WordPriors, uniform_or_none
+from utils.packed_word_list import load_packed_word_list
+from utils.instrumentation import NULL_METRICS, timed
+
+
+class CandidateSolver(Solver):
+    name = "algo_v1"
+
+    def __init__(self, word_list_path, feedback_matrix=None, engine="dict", strategy="random",
+                 guess_list_path=DEFAULT_GUESS_LIST_PATH, decision_tree_path=None, priors=True, max_guesses=6,
+                 metrics=None, refused=None):
+        """
+        :param feedback_matrix: Prebuilt FeedbackMatrix of the guess list against the word list, e.g. attached to
+            shared memory by the tournament runner, built from the files when None.
+        :param engine: "dict" filters with the absent/present/correct letter dictionaries,
+            "matrix" filters with the precomputed feedback matrix (word list as answers, guess list as guesses),
+            "bitset" filters with per-position and per-letter-count bitsets over the word list, for very large lists.
+        :param strategy: Guess selection strategy, see solvers.strategies.STRATEGIES.
+            "random" plays the preset openers and then random candidates, every other strategy scores
+            all allowed guesses and therefore always uses the matrix engine.
+        :param decision_tree_path: Compiled decision tree to play from (see solvers.decision_tree),
+            the strategy scores live once a game leaves the tree.
+        :param priors: solvers.priors.WordPriors weighting how likely each word is to be the answer, used by the guess
+            scoring and the win confidence. True builds them from the solution list, the learned answers and the
+            frequency table of the word list, False treats every word as equally likely.
+        :param max_guesses: Guesses allowed per game, for the win confidence of next_guess().
+        :param metrics: utils.instrumentation.Metrics timing the filtering, disabled when None.
+        :param refused: Set of refused words shared with other solvers, e.g. those of the other browser contexts of
+            concurrent_runner.py. A word any of them adds is excluded here before the next guess.
+        """
+        self.metrics = metrics if metrics is not None else NULL_METRICS
+        self.max_guesses = max_guesses
+        # Memory-mapped word list shared by every game, each game only resets its candidate indices
+        self.packed_word_list = load_packed_word_list(word_list_path)
+        self.word_list_length = len(self.packed_word_list)
+        self.word_length = self.packed_word_list.word_length
+        self.absent = []
+        self.present = {}
+        self.correct = {}
+        self.strategy_name = strategy
+        self.strategy = None if strategy == "random" else get_strategy(strategy)
+        self.engine = "matrix" if self.strategy is not None or decision_tree_path else engine
+        self.feedback_matrix = None
+        self.decision_tree = None
+        # True when the decision tree was compiled for other word lists, e.g. before words were learned
+        self.decision_tree_stale = False
+        self.candidate_index = None
+        if self.engine == "bitset":
+            self.candidate_index = CandidateIndex(self.packed_word_list, self.packed_word_list.letters)
+        if self.engine == "matrix":
+            self.feedback_matrix = feedback_matrix or FeedbackMatrix.from_packed(guess_list_path, self.packed_word_list)
+        if decision_tree_path:
+            self.decision_tree = DecisionTree.load(decision_tree_path)
+            # Its guesses are still valid guesses: a game whose feedback the tree does not know leaves it and scores
+            # live, and a guess the game refuses leaves it too
+            self.decision_tree_stale = self.decision_tree.matrix_key != self.feedback_matrix.key
+        # Every engine keeps its candidates as indices into these words: the matrix answers or the word list
+        self.words = self.feedback_matrix.answers if self.feedback_matrix is not None else self.packed_word_list
+        # Words the game refused: never candidates again and never played again
+        self.excluded = np.zeros(len(self.words), dtype=bool)
+        self.excluded_bits = 0
+        self.refused = refused if refused is not None else set()
+        self.excluded_words = set()
+        self.refused_rows = []
+        if priors is True:
+            priors = WordPriors.for_word_list(word_list_path)
+        self.priors = priors or None
+        self.word_weights = None
+        self.update_word_weights()
+        self.reset()
+
+    def update_word_weights(self):
+        """
+        Computes the prior weight of every word once, the weights of a candidate set are then a single fancy index.
+        Left None when the priors are uniform over the words so the unweighted scoring is kept.
+        """
+        if self.priors is None:
+            return
+        self.word_weights = uniform_or_none(self.priors.weights(self.words))
+
+    def candidate_weights(self, candidates=None):
+        """
+        Prior weights of the candidates, None when unweighted.
+        """
+        if self.word_weights is None:
+            return None
+        return self.word_weights[self.candidates if candidates is None else candidates]
+
+    def reset(self):
+        """
+        Resets the letter constraints and the candidates to every word that was not refused.
+        """
+        self.absent = []
+        self.present = {}
+        self.correct = {}
+        self.rows_seen = 0
+        self.observations = []
+        self.tree_node = 0 if self.decision_tree is not None else None
+        self.exclude_refused()
+        self.candidates = np.flatnonzero(~self.excluded)
+        if self.candidate_index is not None:
+            self.candidate_mask = self.candidate_index.all_bits & ~self.excluded_bits
+
+    def index_of(self, word):
+        """
+        Index of a word in self.words, None when it is not one of them.
+        """
+        if self.feedback_matrix is not None:
+            return self.feedback_matrix.answer_index.get(word)
+        return self.packed_word_list.find(word)
+
+    def refused_guess_rows(self):
+        """
+        Feedback matrix guess rows of the refused words, for the strategies to exclude. None when there are none.
+        """
+        return np.array(self.refused_rows, dtype=np.int64) if self.refused_rows else None
+
+    def reject(self, guess):
+        """
+        Records a guess the game refused, so it is never played or kept as a candidate again.
+        """
+        self.refused.add(guess.upper())
+        for index in self.exclude_refused():
+            self.drop_candidate(index)
+
+    def exclude_refused(self):
+        """
+        Excludes the refused words not excluded yet, including the words added by the solvers sharing self.refused.
+        :return: Indices of the newly excluded words.
+        """
+        indices = []
+        if len(self.excluded_words) == len(self.refused):
+            return indices
+        for word in self.refused.difference(self.excluded_words):
+            self.excluded_words.add(word)
+            index = self.index_of(word)
+            if index is not None:
+                self.excluded[index] = True
+                self.excluded_bits |= 1 << index
+                indices.append(index)
+            if self.feedback_matrix is not None:
+                row = self.feedback_matrix.guess_index.get(word)
+                if row is not None:
+                    self.refused_rows.append(row)
+        return indices
+
+    def drop_candidate(self, index):
+        """
+        Removes one word from the current candidates.
+        """
+        self.candidates = self.candidates[self.candidates != index]
+        if self.candidate_index is not None:
+            self.candidate_mask &= ~(1 << index)
+
+    def observe(self, guess: str, feedback: int):
+        """
+        Queues the row as a (guess, feedback code) observation for the matrix and bitset engines,
+        or updates the letter dictionaries of the dict engine.
+        """
+        self.rows_seen += 1
+        if self.engine != "dict":
+            self.observations.append((guess, feedback))
+            return
+        for col_index, (letter, state) in enumerate(zip(guess, code_to_states(feedback, len(guess)))):
+            if state == 'present':
+                self.present[letter] = col_index
+            elif state == 'correct':
+                self.correct[letter] = col_index
+            elif state == 'absent' and letter not in self.present and letter not in self.correct:
+                self.absent.append(letter)
+
+    def next_guess(self):
+        """
+        Filters with the observed rows and chooses the next guess.
+        """
+        self.filter_word_list()
+        if not len(self.candidates):
+            return None
+        return self.choose_guess(self.win_confidence(self.max_guesses - self.rows_seen))
+
+    def win_confidence(self, guesses_left):
+        """
+        Chance in percent of guessing the answer within guesses_left guesses by drawing from the candidates.
+        """
+        return get_win_confidence(self.candidates, self.word_list_length, guesses_left, self.candidate_weights())
+
+    def choose_guess(self, win_conf=0):
+        """
+        Chooses the next guess and removes it from the candidates, the turn is the number of observed rows.
+        :return: The chosen word.
+        """
+        # The 3 first guesses are preset:
+        # preset_guesses = ['SLATE', 'BRICK', 'JUMPY', 'VOZHD', 'FUNGI', 'WRECK']
+        # preset_guesses = ['BANGS', 'CHORD', 'VEXIL', 'JUMPY', 'TWERK', 'FUNGI']
+        # preset_guesses = ['JUMPY', 'VEXIL', 'CHORD', 'BANGS']
+        # preset_guesses = ['HATES', 'ROUND', 'CLIMB']
+        preset_guesses = ['FRAUD', 'MELON', 'SIGHT', 'CLIMB', 'VOZHD']
+        # preset_guesses = ['CONES', 'TRIAL']
+        # preset_guesses = ['TALES']
+        # preset_guesses = []
+        for index in self.exclude_refused():
+            self.drop_candidate(index)
+        preset_guesses = [word for word in preset_guesses if len(word) == self.word_length and word not in self.refused]
+        if self.tree_node is not None and self.decision_tree.guess(self.tree_node) in self.refused:
+            # The game refuses the tree guess, leave the tree and score live
+            self.tree_node = None
+        index = None
+        if self.tree_node is not None:
+            guess = self.decision_tree.guess(self.tree_node)
+        elif self.strategy is not None:
+            guess = self.strategy.choose(self.feedback_matrix, self.candidates, self.candidate_weights(),
+                                         self.refused_guess_rows())
+        elif self.rows_seen < len(preset_guesses) and win_conf < 100:
+            guess = preset_guesses[self.rows_seen]
+        else:
+            weights = self.candidate_weights()
+            index = int(random.choice(self.candidates) if weights is None else random.choices(self.candidates, weights=weights)[0])
+            guess = self.words[index]
+        if index is None:
+            index = self.index_of(guess)
+        if index is not None:
+            self.drop_candidate(index)
+        return guess
+
+    @timed("filter")
+    def filter_word_list(self):
+        """
+        Filters the candidates with the rows observed since the last call.
+        """
+        if self.feedback_matrix is not None:
+            self.filter_candidates()
+        elif self.candidate_index is not None:
+            self.filter_bitset()
+        else:
+            self.filter_letters()
+
+    def filter_letters(self):
+        """
+        Filters the dict engine candidates with the letter dictionaries, one vectorized mask over the letter
+        rows of the candidates per constraint.
+        """
+        rows = self.packed_word_list.letters[self.candidates]
+        keep = np.ones(len(self.candidates), dtype=bool)
+
+        # Remove all words that contain letters in the 'absent' list
+        # Do not remove the letters that are in the 'present' or 'correct' dictionaries
+        for letter in set(self.absent):
+            if letter not in self.correct and letter not in self.present:
+                keep &= ~(rows == ord(letter) - ord("A")).any(axis=1)
+
+        # Remove all words that do not contain letters in the 'present' dictionary
+        for letter, col_index in self.present.items():
+            code = ord(letter) - ord("A")
+            keep &= (rows == code).any(axis=1) & (rows[:, col_index] != code)
+
+        # Remove all words that do not contain letters in the 'correct' dictionary
+        for letter, col_index in self.correct.items():
+            keep &= rows[:, col_index] == ord(letter) - ord("A")
+        self.candidates = self.candidates[keep]
+
+    def filter_candidates(self):
+        """
+        Filters the matrix engine candidates with one vectorized mask per observed row.
+        Unlike the letter dictionaries this handles repeated letters exactly.
+        """
+        for guess, code in self.observations:
+            self.candidates = self.feedback_matrix.filter(self.candidates, guess, code)
+            if self.tree_node is not None:
+                self.tree_node = self.decision_tree.next_node(self.tree_node, guess, code)
+        self.observations = []
+
+    def filter_bitset(self):
+        """
+        Filters the bitset engine candidates with a few AND / AND NOT operations per observed row.
+        """
+        for guess, code in self.observations:
+            self.candidate_mask = self.candidate_index.apply_feedback(self.candidate_mask, guess, code_to_states(code, len(guess)))
+        self.observations = []
+        self.candidates = self.candidate_index.indices(self.candidate_mask)
+
+    def learn_answer(self, word):
+        """
+        Raises the prior of a word revealed as an answer for the next games.
+        :return: True when the weights changed.
+        """
+        if self.priors is None or not self.priors.learn_answer(word):
+            return False
+        self.update_word_weights()
+        if self.strategy is not None:
+            # The opening was scored with the old priors
+            self.strategy.opening_guess = None
+        return True
+
+
+def get_win_confidence(word_list, word_list_length, guesses_left, weights=None):
+    words_left = max(len(word_list), 1)
+    if words_left == 1:
+        return 100.0
+    if guesses_left < words_left:
+        # Estimate win confidence based on the probability of guessing the correct word in the remaining guesses
+        if weights is not None:
+            # Each guess drawn by prior: sum of p * P(drawn at least once), the uniform formula when p = 1 / n
+            p = np.asarray(weights, dtype=np.float64)
+            p = p / p.sum()
+            prob = float(np.sum(p * (1 - (1 - p) ** guesses_left)))
+            return round(prob * 100, 2)
+        prob = 1 - ((words_left - 1) / words_left) ** guesses_left
+        return round(prob * 100, 2)
+    return 100.0
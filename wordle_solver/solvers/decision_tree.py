@@ -0,0 +1,163 @@
+"""
+Decision tree / opening book.
+Runs a guess strategy offline over every reachable (guess history, feedback) path of the solution list
+and stores the next guess of each path, so playing a game only needs a dictionary lookup per turn.
+
+Binary layout (little endian):
+    header: magic b"WDTR", version u8, word length u8, node count u32, edge count u32, guess word count u32,
+            feedback matrix key (16 ascii bytes), strategy name (16 ascii bytes, zero padded)
+    words:  every distinct guess of the tree, word length ascii bytes each
+    nodes:  index of the node's guess in words u32 per node, then the first edge of every node u32
+            (node count + 1 entries)
+    edges:  feedback code u32 per edge, then the child node u32 per edge
+The guess words are stored in the file, so a tree plays without loading the word lists or the feedback matrix.
+
+Usage:
+    python wordle_solver/solvers/decision_tree.py --strategy entropy
+"""
+
+import argparse
+import os
+import struct
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from solvers.feedback_matrix import FeedbackMatrix, DEFAULT_ANSWER_LIST_PATH, DEFAULT_GUESS_LIST_PATH, DEFAULT_CACHE_DIR
+from solvers.strategies import get_strategy
+from utils.packed_word_list import load_packed_word_list
+
+MAGIC = b"WDTR"
+VERSION = 2
+HEADER = struct.Struct("<4sBBIII16s16s")
+
+
+class DecisionTree:
+    """
+    Compiled decision tree. Node 0 is the root, every node stores the guess to play and
+    the child node for each feedback code observed after playing it.
+    """
+    def __init__(self, guesses, guess_words, transitions, matrix_key, strategy_name, word_length=5):
+        """
+        :param guesses: Index in guess_words of the guess of every node.
+        :param guess_words: Distinct guesses played by the tree.
+        """
+        self.guesses = guesses
+        self.guess_words = guess_words
+        self.transitions = transitions
+        self.matrix_key = matrix_key
+        self.strategy_name = strategy_name
+        self.word_length = word_length
+
+    @classmethod
+    def compile(cls, feedback_matrix: FeedbackMatrix, strategy, max_depth=12):
+        """
+        Expands the strategy over every feedback path starting from the full answer list.
+        """
+        guesses = []
+        word_index = {}
+        transitions = {}
+        win_code = 3 ** feedback_matrix.word_length - 1
+
+        def expand(candidates, depth):
+            node = len(guesses)
+            guess = strategy.choose(feedback_matrix, candidates)
+            guesses.append(word_index.setdefault(guess, len(word_index)))
+            if depth >= max_depth:
+                return node
+            codes = feedback_matrix.codes_for(guess, candidates)
+            order = np.argsort(codes, kind='stable')
+            unique_codes, starts = np.unique(codes[order], return_index=True)
+            for code, bucket in zip(unique_codes, np.split(candidates[order], starts[1:])):
+                if code != win_code:
+                    transitions[(node, int(code))] = expand(bucket, depth + 1)
+            return node
+
+        expand(feedback_matrix.all_candidates(), 1)
+        return cls(guesses, list(word_index), transitions, feedback_matrix.key, strategy.name, feedback_matrix.word_length)
+
+    def save(self, path):
+        """
+        Serializes the tree to the compact binary format described in the module docstring.
+        """
+        edges = sorted(self.transitions.items())
+        edge_start = np.zeros(len(self.guesses) + 1, dtype='<u4')
+        for (node, _), _ in edges:
+            edge_start[node + 1] += 1
+        edge_start = np.cumsum(edge_start, dtype='<u4')
+        header = HEADER.pack(MAGIC, VERSION, self.word_length, len(self.guesses), len(edges), len(self.guess_words),
+                             self.matrix_key.encode("ascii"), self.strategy_name.encode("ascii"))
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as file:
+            file.write(header)
+            file.write("".join(self.guess_words).encode("ascii"))
+            file.write(np.asarray(self.guesses, dtype='<u4').tobytes())
+            file.write(edge_start.tobytes())
+            file.write(np.array([code for (_, code), _ in edges], dtype='<u4').tobytes())
+            file.write(np.array([child for _, child in edges], dtype='<u4').tobytes())
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Loads a tree from disk.
+        The tree plays with any word lists since it stores its own guess words, compare its matrix_key with
+        FeedbackMatrix.key to know whether it was compiled for the current ones.
+        """
+        with open(path, 'rb') as file:
+            data = file.read()
+        magic, version, word_length, n_nodes, n_edges, n_words, key, strategy_name = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a decision tree file of version {VERSION}, recompile it.")
+        key = key.decode("ascii")
+        words_end = HEADER.size + n_words * word_length
+        words = data[HEADER.size:words_end].decode("ascii")
+        guess_words = [words[i:i + word_length] for i in range(0, len(words), word_length)]
+        arrays = np.frombuffer(data, dtype='<u4', offset=words_end)
+        guesses = arrays[:n_nodes].tolist()
+        edge_start = arrays[n_nodes:2 * n_nodes + 1]
+        codes = arrays[2 * n_nodes + 1:2 * n_nodes + 1 + n_edges].tolist()
+        children = arrays[2 * n_nodes + 1 + n_edges:2 * n_nodes + 1 + 2 * n_edges].tolist()
+        nodes = np.repeat(np.arange(n_nodes), np.diff(edge_start)).tolist()
+        transitions = {(node, code): child for node, code, child in zip(nodes, codes, children)}
+        return cls(guesses, guess_words, transitions, key, strategy_name.rstrip(b"\0").decode("ascii"), word_length)
+
+    def guess(self, node):
+        """
+        Returns the word to play at a node.
+        """
+        return self.guess_words[self.guesses[node]]
+
+    def next_node(self, node, guess, code):
+        """
+        Follows the edge for an observed (guess, feedback code) pair.
+        :return: The child node, or None if the game left the tree and the solver must score live.
+        """
+        if node is None or guess != self.guess(node):
+            return None
+        return self.transitions.get((node, code))
+
+
+def default_tree_path(feedback_matrix: FeedbackMatrix, strategy_name):
+    return os.path.join(DEFAULT_CACHE_DIR, f"decision_tree_{strategy_name}_{feedback_matrix.key}.bin")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile a decision tree for a guess strategy.")
+    parser.add_argument("--strategy", default="entropy")
+    parser.add_argument("--word-list", default=DEFAULT_ANSWER_LIST_PATH, help="Answer list the solver loads.")
+    parser.add_argument("--guess-list", default=DEFAULT_GUESS_LIST_PATH)
+    parser.add_argument("--output", default=None, help="Defaults to the cache directory.")
+    args = parser.parse_args()
+
+    feedback_matrix = FeedbackMatrix.from_packed(args.guess_list, load_packed_word_list(args.word_list))
+    tree = DecisionTree.compile(feedback_matrix, get_strategy(args.strategy))
+    output = args.output or default_tree_path(feedback_matrix, args.strategy)
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    tree.save(output)
+    print(f"Compiled {len(tree.guesses)} nodes and {len(tree.transitions)} edges to {output}")
+
+
+if __name__ == "__main__":
+    main()
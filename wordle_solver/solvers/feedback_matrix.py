@@ -0,0 +1,334 @@
+"""
+Feedback matrix engine.
+Precomputes the Wordle response of every (guess, answer) pair as a base-3 code so that
+filtering the candidate list becomes a single vectorized comparison.
+Tile states are encoded as absent = 0, present = 1, correct = 2 and position i has weight 3 ** i.
+Codes are stored in the narrowest unsigned type of the word length (8 bits up to 5 letters, 16 bits up to 10),
+and lists too large for a full matrix are scored lazily, one block of guess rows at a time.
+A built matrix can be copied into shared memory once and attached read-only by worker processes (share / attach).
+Matrices read from an answer list file are cached per version of that file: when words were only appended to it
+(e.g. learned words) the cached matrix of the previous version is extended with the new rows and columns instead of
+being rebuilt, and the cache files of earlier versions are deleted.
+"""
+
+import glob
+import hashlib
+import os
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from models.tile import code_typecode, states_to_code
+
+UTILS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "utils")
+DEFAULT_GUESS_LIST_PATH = os.path.join(UTILS_DIR, "wordle_allowed_guesses.txt")
+DEFAULT_ANSWER_LIST_PATH = os.path.join(UTILS_DIR, "wordle_unlimited_solutionlist.txt")
+DEFAULT_CACHE_DIR = os.path.join(UTILS_DIR, "cache")
+# Above this size the matrix is not precomputed, guess rows are computed on demand instead
+DEFAULT_MAX_MATRIX_BYTES = 1 << 30
+# Upper bound on the (guesses, answers, 26) letter count scratch array of one computed block
+BLOCK_COUNT_BYTES = 1 << 26
+
+
+def code_dtype(word_length: int):
+    """
+    Narrowest unsigned numpy type holding every feedback code of a word length, see models.tile.code_typecode.
+    """
+    return np.dtype(code_typecode(word_length)).type
+
+
+def encode_feedback(guess: str, answer: str) -> int:
+    """
+    Computes the feedback code of a guess against an answer, handling duplicate letters like the game does:
+    greens are assigned first, then yellows are handed out left to right while unmatched copies remain.
+    :return: Base-3 feedback code.
+    """
+    states = [0] * len(guess)
+    remaining = {}
+    for i, (g, a) in enumerate(zip(guess, answer)):
+        if g == a:
+            states[i] = 2
+        else:
+            remaining[a] = remaining.get(a, 0) + 1
+    for i, g in enumerate(guess):
+        if states[i] == 0 and remaining.get(g, 0) > 0:
+            states[i] = 1
+            remaining[g] -= 1
+    return states_to_code(states)
+
+
+def words_to_array(words) -> np.ndarray:
+    """
+    Converts a list of equal length words to a (len(words), word_length) uint8 array of letter indices.
+    """
+    if not words:
+        return np.zeros((0, 0), dtype=np.uint8)
+    raw = np.frombuffer("".join(words).encode("ascii"), dtype=np.uint8)
+    return (raw.reshape(len(words), -1) - ord("A")).astype(np.uint8)
+
+
+def compute_feedback_block(guess_array: np.ndarray, answer_array: np.ndarray) -> np.ndarray:
+    """
+    Computes the feedback codes of a block of guesses against all answers.
+    :param guess_array: (g, word_length) letter index array.
+    :param answer_array: (a, word_length) letter index array.
+    :return: (g, a) array of feedback codes, typed by code_dtype.
+    """
+    n_guesses, word_length = guess_array.shape
+    n_answers = answer_array.shape[0]
+    rows = np.arange(n_guesses)
+
+    answer_counts = np.zeros((n_answers, 26), dtype=np.int8)
+    for j in range(word_length):
+        np.add.at(answer_counts, (np.arange(n_answers), answer_array[:, j]), 1)
+
+    green = guess_array[:, None, :] == answer_array[None, :, :]
+    remaining = np.broadcast_to(answer_counts, (n_guesses, n_answers, 26)).copy()
+    for i in range(word_length):
+        remaining[rows, :, guess_array[:, i]] -= green[:, :, i]
+
+    dtype = code_dtype(word_length)
+    codes = np.zeros((n_guesses, n_answers), dtype=dtype)
+    for i in range(word_length):
+        letters = guess_array[:, i]
+        yellow = ~green[:, :, i] & (remaining[rows, :, letters] > 0)
+        remaining[rows, :, letters] -= yellow
+        codes += ((green[:, :, i] * 2 + yellow).astype(dtype) * dtype(3 ** i))
+    return codes
+
+
+def read_words(path):
+    """
+    Reads a word list file, normalizing to upper case and dropping duplicates while keeping the file order.
+    """
+    with open(path, 'r') as file:
+        words = [line.strip().upper() for line in file]
+    return list(dict.fromkeys(word for word in words if word))
+
+
+class FeedbackMatrix:
+    """
+    Guess x answer matrix of feedback codes.
+    Every answer is also a valid guess, so the answers are appended to the guess list when missing.
+    Guesses of another length than the answers are dropped.
+    When the full matrix would exceed max_matrix_bytes it is not built: `matrix` is None and block()
+    computes the requested guess rows against the requested candidates only.
+    """
+    def __init__(self, guesses, answers, cache_dir=DEFAULT_CACHE_DIR, block_size=256, max_matrix_bytes=DEFAULT_MAX_MATRIX_BYTES,
+                 matrix=None, source=None):
+        """
+        :param matrix: Already built (guesses, answers) codes, e.g. attached from shared memory, instead of loading them.
+        :param source: Path of the answer list file the answers were read from, enables the incremental cache.
+        """
+        self.answers = list(answers)
+        self.word_length = len(self.answers[0]) if self.answers else 5
+        answer_set = set(self.answers)
+        guesses = [word for word in guesses if len(word) == self.word_length]
+        self.base_guesses = guesses
+        guess_set = set(guesses)
+        self.guesses = guesses + [word for word in self.answers if word not in guess_set]
+        self.guess_index = {word: i for i, word in enumerate(self.guesses)}
+        self.answer_index = {word: i for i, word in enumerate(self.answers)}
+        self.guess_is_answer = np.array([word in answer_set for word in self.guesses], dtype=bool)
+        self.dtype = code_dtype(self.word_length)
+        self.cache_dir = cache_dir
+        self.block_size = block_size
+        self.source = source
+        self.key = self.hash_word_lists(self.guesses, self.answers)
+        self.guess_array = words_to_array(self.guesses)
+        self.answer_array = words_to_array(self.answers)
+        self.shared_memory = None
+        if matrix is not None:
+            if matrix.shape != (len(self.guesses), len(self.answers)):
+                raise ValueError(f"Matrix shape {matrix.shape} does not match {len(self.guesses)} guesses x {len(self.answers)} answers")
+            self.lazy = False
+            self.matrix = matrix
+            return
+        self.lazy = len(self.guesses) * len(self.answers) * np.dtype(self.dtype).itemsize > max_matrix_bytes
+        self.matrix = None if self.lazy else self.load_or_build()
+
+    @classmethod
+    def from_files(cls, guess_list_path=DEFAULT_GUESS_LIST_PATH, answer_list_path=DEFAULT_ANSWER_LIST_PATH, **kwargs):
+        """
+        Builds the matrix from two word list files.
+        """
+        return cls(read_words(guess_list_path), read_words(answer_list_path), source=answer_list_path, **kwargs)
+
+    @classmethod
+    def from_packed(cls, guess_list_path, packed_word_list, **kwargs):
+        """
+        Builds the matrix from a guess list file and the answers of a utils.packed_word_list.PackedWordList.
+        """
+        answers = list(dict.fromkeys(packed_word_list))
+        return cls(read_words(guess_list_path), answers, source=packed_word_list.text_path, **kwargs)
+
+    @staticmethod
+    def hash_word_lists(guesses, answers) -> str:
+        digest = hashlib.sha256()
+        digest.update("\n".join(guesses).encode("ascii"))
+        digest.update(b"\0")
+        digest.update("\n".join(answers).encode("ascii"))
+        return digest.hexdigest()[:16]
+
+    @property
+    def cache_prefix(self):
+        """
+        File name prefix shared by the caches of every version of the same answer list file and guess list.
+        """
+        if self.source is None:
+            return "feedback_"
+        source_key = self.hash_word_lists(self.base_guesses, [os.path.abspath(self.source)])
+        return f"feedback_{source_key}_"
+
+    @property
+    def cache_path(self):
+        return os.path.join(self.cache_dir, f"{self.cache_prefix}{self.key}.npy")
+
+    @staticmethod
+    def answers_path_for(cache_path):
+        """
+        Answers of a cached matrix, written next to it to find the matrix a later version can extend.
+        """
+        return os.path.splitext(cache_path)[0] + ".answers"
+
+    def load_or_build(self) -> np.ndarray:
+        """
+        Loads the matrix memory-mapped from the cache, building and caching it first if needed.
+        """
+        if self.cache_dir is None:
+            return self.build()
+        if not os.path.exists(self.cache_path):
+            os.makedirs(self.cache_dir, exist_ok=True)
+            matrix = self.extend_cached()
+            if matrix is None:
+                matrix = self.build()
+            # Write to temporary files first so a crash never leaves a truncated cache behind
+            if self.source is not None:
+                answers_path = self.answers_path_for(self.cache_path)
+                with open(f"{answers_path}.{os.getpid()}.tmp", 'w') as file:
+                    file.write("\n".join(self.answers) + "\n")
+                os.replace(f"{answers_path}.{os.getpid()}.tmp", answers_path)
+            tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as file:
+                np.save(file, matrix)
+            os.replace(tmp_path, self.cache_path)
+            self.prune_cache()
+        return np.load(self.cache_path, mmap_mode='r')
+
+    def extend_cached(self):
+        """
+        Builds the matrix from the cached matrix of an earlier version of the answer list file whose answers are a
+        prefix of the current ones, only the new guess rows and answer columns are computed.
+        :return: The matrix, or None when no such cache exists.
+        """
+        if self.source is None:
+            return None
+        base_guess_set = set(self.base_guesses)
+        for path in glob.glob(os.path.join(self.cache_dir, f"{self.cache_prefix}*.npy")):
+            try:
+                old_answers = read_words(self.answers_path_for(path))
+                old = np.load(path, mmap_mode='r')
+            except (OSError, ValueError):
+                continue
+            n_answers = len(old_answers)
+            n_guesses = len(self.base_guesses) + sum(word not in base_guess_set for word in old_answers)
+            if old.shape != (n_guesses, n_answers) or self.answers[:n_answers] != old_answers:
+                continue
+            matrix = np.empty((len(self.guesses), len(self.answers)), dtype=self.dtype)
+            matrix[:n_guesses, :n_answers] = old
+            matrix[:n_guesses, n_answers:] = self.compute_rows(self.guess_array[:n_guesses], self.answer_array[n_answers:])
+            matrix[n_guesses:] = self.compute_rows(self.guess_array[n_guesses:], self.answer_array)
+            return matrix
+        return None
+
+    def prune_cache(self):
+        """
+        Deletes the cached matrices of earlier versions of the answer list file, they are never loaded again.
+        Processes still memory-mapping one keep their mapping, a file that cannot be deleted is left for the next build.
+        """
+        if self.source is None:
+            return
+        keep = {self.cache_path, self.answers_path_for(self.cache_path)}
+        for pattern in ("*.npy", "*.answers"):
+            for path in glob.glob(os.path.join(self.cache_dir, f"{self.cache_prefix}{pattern}")):
+                if path not in keep:
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+
+    def share(self) -> shared_memory.SharedMemory:
+        """
+        Copies the matrix into a new shared memory block for attach().
+        The caller owns the block and must close and unlink it once the workers are done.
+        """
+        if self.matrix is None:
+            raise ValueError("A lazy feedback matrix has no precomputed codes to share")
+        block = shared_memory.SharedMemory(create=True, size=max(self.matrix.nbytes, 1))
+        np.ndarray(self.matrix.shape, dtype=self.dtype, buffer=block.buf)[:] = self.matrix
+        return block
+
+    @classmethod
+    def attach(cls, guesses, answers, shared_memory_name, **kwargs):
+        """
+        Creates a matrix whose codes are a read-only view of a block created by share(), nothing is loaded or built.
+        :param guesses: The guesses of the shared matrix, in order.
+        :param answers: The answers of the shared matrix, in order.
+        """
+        block = shared_memory.SharedMemory(name=shared_memory_name)
+        answers = list(answers)
+        word_length = len(answers[0]) if answers else 5
+        n_guesses = len(guesses)
+        matrix = np.ndarray((n_guesses, len(answers)), dtype=code_dtype(word_length), buffer=block.buf)
+        matrix.flags.writeable = False
+        feedback_matrix = cls(guesses, answers, matrix=matrix, **kwargs)
+        # The view is only valid while the block is open
+        feedback_matrix.shared_memory = block
+        return feedback_matrix
+
+    def build(self) -> np.ndarray:
+        """
+        Computes the full matrix block by block to keep peak memory low.
+        """
+        return self.compute_rows(self.guess_array, self.answer_array)
+
+    def compute_rows(self, guess_array: np.ndarray, answer_array: np.ndarray) -> np.ndarray:
+        """
+        Computes the feedback codes of guesses against answers in blocks of at most block_size guesses,
+        fewer when the answer list is so long that the per-block letter counts would outgrow BLOCK_COUNT_BYTES.
+        """
+        rows_per_block = max(1, min(self.block_size, BLOCK_COUNT_BYTES // max(26 * len(answer_array), 1)))
+        codes = np.empty((len(guess_array), len(answer_array)), dtype=self.dtype)
+        for start in range(0, len(guess_array), rows_per_block):
+            stop = start + rows_per_block
+            codes[start:stop] = compute_feedback_block(guess_array[start:stop], answer_array)
+        return codes
+
+    def block(self, guess_rows, candidates: np.ndarray) -> np.ndarray:
+        """
+        Returns the (guesses, candidates) feedback codes of a slice or index array of guess rows.
+        """
+        if self.matrix is not None:
+            return self.matrix[guess_rows][:, candidates]
+        return self.compute_rows(self.guess_array[guess_rows], self.answer_array[candidates])
+
+    def codes_for(self, guess: str, candidates: np.ndarray) -> np.ndarray:
+        """
+        Returns the feedback codes of a guess against the given answer indices.
+        Words outside the guess list are scored on the fly.
+        """
+        index = self.guess_index.get(guess)
+        if index is not None and self.matrix is not None:
+            return self.matrix[index, candidates]
+        if len(candidates) == 0:
+            return np.zeros(0, dtype=self.dtype)
+        return self.compute_rows(words_to_array([guess]), self.answer_array[candidates])[0]
+
+    def filter(self, candidates: np.ndarray, guess: str, code: int) -> np.ndarray:
+        """
+        Keeps only the candidate answer indices consistent with the observed feedback code.
+        """
+        return candidates[self.codes_for(guess, candidates) == code]
+
+    def all_candidates(self) -> np.ndarray:
+        return np.arange(len(self.answers))
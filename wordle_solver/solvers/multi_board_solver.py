@@ -0,0 +1,173 @@
+"""
+Multi-board solver (Quordle / Octordle style games).
+MultiBoardCandidates keeps one candidate set per board over the words of a matrix engine CandidateSolver, which
+holds the feedback matrix, the priors and the refused words shared by all boards.
+Each guess is chosen for all unsolved boards together: the strategy scores every allowed guess against the
+candidates of every board in one batched pass and sums the per-board scores, see GuessStrategy.choose_boards.
+multiBoardSolverV1 drives it on a multi-board game like algoSolverV1 drives a single board.
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from solvers.algo_solver_v1 import algoSolverV1
+from solvers.candidate_solver import get_win_confidence
+from solvers.strategies import get_strategy
+from utils.instrumentation import timed
+
+
+class MultiBoardCandidates:
+    """
+    Candidates of every board of a multi-board game.
+    """
+
+    def __init__(self, solver, num_boards, strategy):
+        """
+        :param solver: Matrix engine CandidateSolver providing the words, their weights and the refused words.
+        :param strategy: Strategy name, "random" plays a random candidate of a random unsolved board.
+        """
+        self.solver = solver
+        self.feedback_matrix = solver.feedback_matrix
+        self.num_boards = num_boards
+        # The solver's strategy when it has one, so learned answers reset its opening, it has none for "random"
+        self.strategy = solver.strategy or get_strategy(strategy)
+        self.priors = solver.priors
+        self.metrics = solver.metrics
+        self.reset()
+
+    def reset(self):
+        """
+        Resets the candidates of every board to every word that was not refused.
+        """
+        self.solver.reset()
+        self.rows_seen = [0] * self.num_boards
+        self.observations = [[] for _ in range(self.num_boards)]
+        self.candidates = self.solver.candidates
+        self.candidate_sets = [self.candidates] * self.num_boards
+        self.solved = [False] * self.num_boards
+
+    def observe(self, board_index, guess, feedback):
+        """
+        Queues an accepted row of one board.
+        """
+        self.rows_seen[board_index] += 1
+        self.observations[board_index].append((guess, feedback))
+
+    def unsolved_boards(self):
+        return [board_index for board_index in range(self.num_boards) if not self.solved[board_index]]
+
+    @timed("filter")
+    def filter_word_list(self):
+        """
+        Filters the candidates of every board, self.candidates is the union of the unsolved boards' candidates.
+        """
+        for board_index, observations in enumerate(self.observations):
+            candidates = self.candidate_sets[board_index]
+            for guess, code in observations:
+                candidates = self.feedback_matrix.filter(candidates, guess, code)
+            self.candidate_sets[board_index] = candidates
+            observations.clear()
+        unsolved = [self.candidate_sets[board_index] for board_index in self.unsolved_boards()]
+        self.candidates = np.unique(np.concatenate(unsolved)) if unsolved else np.zeros(0, dtype=np.int64)
+
+    def choose_guess(self, win_conf=0):
+        """
+        Chooses the next guess for all unsolved boards and removes it from their candidates.
+        """
+        candidate_sets = [self.candidate_sets[i] for i in self.unsolved_boards() if len(self.candidate_sets[i])]
+        weight_sets = None if self.solver.word_weights is None else [self.solver.candidate_weights(c) for c in candidate_sets]
+        guess = self.strategy.choose_boards(self.feedback_matrix, candidate_sets, weight_sets, self.solver.refused_guess_rows())
+        index = self.solver.index_of(guess)
+        if index is not None:
+            self.drop_candidate(index)
+        return guess
+
+    def drop_candidate(self, index):
+        """
+        Removes one word from the candidates of every board.
+        """
+        self.candidates = self.candidates[self.candidates != index]
+        self.candidate_sets = [candidates[candidates != index] for candidates in self.candidate_sets]
+
+    def reject(self, guess):
+        """
+        Records a guess the game refused, for every board.
+        """
+        self.solver.reject(guess)
+        index = self.solver.index_of(guess.upper())
+        if index is not None:
+            self.drop_candidate(index)
+
+    def learn_answer(self, word):
+        return self.solver.learn_answer(word)
+
+    def win_confidence(self, guesses_left):
+        """
+        Win confidence of the hardest unsolved board, given one guess per unsolved board.
+        """
+        unsolved = self.unsolved_boards()
+        win_conf = 100.0
+        for board_index in unsolved:
+            candidates = self.candidate_sets[board_index]
+            win_conf = min(win_conf, get_win_confidence(candidates, self.solver.word_list_length, max(guesses_left - len(unsolved) + 1, 0),
+                                                        self.solver.candidate_weights(candidates)))
+        return win_conf
+
+
+class multiBoardSolverV1(algoSolverV1):
+    def __init__(self, word_list_path, game, strategy="entropy", **kwargs):
+        """
+        :param game: Multi-board game backend, e.g. SimulatedMultiWordleGame.
+        :param strategy: Guess selection strategy, "random" plays a random candidate of a random unsolved board.
+        Other keyword arguments are passed to algoSolverV1, the engine is always "matrix".
+        """
+        kwargs["engine"] = "matrix"
+        kwargs.pop("decision_tree_path", None)
+        super().__init__(word_list_path, game=game, strategy=strategy, **kwargs)
+        self.solver = MultiBoardCandidates(self.solver, game.num_boards, strategy)
+
+    @timed("update_letters")
+    def update_letters(self, game):
+        # Observe the new rows of every board
+        for board_index, board in enumerate(game.boards):
+            for row_index in range(self.solver.rows_seen[board_index], len(board)):
+                self.solver.observe(board_index, board.words[row_index], board.codes[row_index])
+            self.solver.solved[board_index] = board.won
+
+    def rows_played(self, game):
+        return game.guess_count
+
+    def lost_answers(self, game):
+        return game.get_answers() if game.game_state == 'lost' else []
+
+    def record_history(self, game, removed_words, answers):
+        # The game history only stores single board games
+        pass
+
+    @timed("render")
+    def show_state(self, game, removed_words):
+        """
+        Sends a snapshot of every board to the dashboard.
+        :return: The win confidence of the hardest unsolved board.
+        """
+        guesses_left = game.max_rows - game.guess_count
+        win_conf = self.solver.win_confidence(guesses_left)
+        if self.dashboard.enabled:
+            self.dashboard.publish(
+                "state",
+                boards=tuple(
+                    tuple(tuple((tile.letter, tile.state) for tile in row) for row in board.rows)
+                    for board in game.boards
+                ),
+                game_state=game.game_state,
+                words_left=len(self.solver.candidates),
+                guesses_left=guesses_left,
+                win_conf=win_conf,
+                removed_words=tuple(removed_words),
+                win_rate=self.win_rate,
+            )
+        return win_conf
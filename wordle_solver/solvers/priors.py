@@ -0,0 +1,90 @@
+"""
+Prior likelihood of every word being the answer.
+Word lists such as self_creating_list.txt mix real answers with words that are only valid guesses, so candidates are
+weighted instead of treated as equally likely:
+
+    weight = (1 + log(1 + frequency)) * (ANSWER_WEIGHT if the word is a known answer else 1)
+
+Known answers are the words of the solution list plus the answers learned from lost games (the .answers file next to
+the word list), frequencies come from the word<TAB>count table next to the word list (.freq, see
+utils/build_word_lists.py) when there is one.
+"""
+
+import os
+
+import numpy as np
+
+from solvers.feedback_matrix import DEFAULT_ANSWER_LIST_PATH, read_words
+from utils.word_list_journal import read_learned_answers
+
+# How much more likely a known answer is than any other word
+ANSWER_WEIGHT = 25.0
+
+
+def frequency_path_for(word_list_path):
+    return os.path.splitext(word_list_path)[0] + ".freq"
+
+
+def read_frequencies(path) -> dict:
+    """
+    Reads a word<TAB>count table with upper case keys, empty when the file does not exist.
+    """
+    frequencies = {}
+    if not os.path.exists(path):
+        return frequencies
+    with open(path, 'r') as file:
+        for line in file:
+            word, _, count = line.strip().partition("\t")
+            if count:
+                frequencies[word.upper()] = int(count)
+    return frequencies
+
+
+class WordPriors:
+    def __init__(self, answers=(), frequencies=None, answer_weight=ANSWER_WEIGHT):
+        """
+        :param answers: Words known to be answers.
+        :param frequencies: Word to count mapping.
+        :param answer_weight: Weight multiplier of the known answers.
+        """
+        self.answers = set(word.upper() for word in answers)
+        self.frequencies = frequencies or {}
+        self.answer_weight = answer_weight
+
+    @classmethod
+    def for_word_list(cls, word_list_path, solution_list_path=DEFAULT_ANSWER_LIST_PATH, **kwargs):
+        """
+        Priors of a word list: its solution list, learned answers and frequency table.
+        """
+        answers = read_words(solution_list_path) if solution_list_path and os.path.exists(solution_list_path) else []
+        answers += [word.upper() for word in read_learned_answers(word_list_path)]
+        return cls(answers, read_frequencies(frequency_path_for(word_list_path)), **kwargs)
+
+    def weights(self, words) -> np.ndarray:
+        """
+        Prior weights of a list of words, unnormalized.
+        """
+        frequencies = np.fromiter((self.frequencies.get(word, 0) for word in words), dtype=np.float64, count=len(words))
+        is_answer = np.fromiter((word in self.answers for word in words), dtype=bool, count=len(words))
+        weights = 1.0 + np.log1p(frequencies)
+        weights[is_answer] *= self.answer_weight
+        return weights
+
+    def learn_answer(self, word) -> bool:
+        """
+        :return: False if the word was already a known answer.
+        """
+        word = word.upper()
+        if word in self.answers:
+            return False
+        self.answers.add(word)
+        return True
+
+
+def uniform_or_none(weights):
+    """
+    Returns None when every weight is the same, so callers can keep their faster unweighted path.
+    """
+    if weights is None or len(weights) == 0 or np.all(weights == weights[0]):
+        return None
+    return weights
@@ -0,0 +1,268 @@
+"""
+Guess selection strategies.
+Each strategy picks the next guess from the feedback matrix given the current candidate answer indices.
+Scoring strategies histogram the feedback codes of every allowed guess with one batched bincount per block.
+For multi-board games the candidates of every unsolved board are histogrammed in the same bincount, each board
+offset into its own range of codes, and the per-board scores are summed.
+When candidate prior weights are given (see solvers.priors) the buckets hold summed weights instead of counts, so
+every score becomes an expectation over the prior rather than over equally likely candidates.
+"""
+
+import random
+
+import numpy as np
+
+# Upper bound on the number of histogram cells of one block of guesses
+MAX_HISTOGRAM_CELLS = 1 << 24
+
+
+def feedback_histograms(codes, num_codes=243, weights=None):
+    """
+    Counts how many candidates fall in each feedback bucket for every guess.
+    When there are far fewer candidates than feedback codes (late turns, long words) the buckets are counted by
+    sorting each row instead, so the result only has one column per candidate rather than one per code.
+    The columns then no longer map to codes, which the scores below never need.
+    :param codes: (guesses, candidates) feedback code block.
+    :param weights: Optional prior weight of every candidate column, buckets then sum the weights.
+    :return: (guesses, histogram_width(num_codes, candidates)) array of bucket sizes.
+    """
+    n_guesses, n_candidates = codes.shape
+    if weights is not None:
+        weights = np.broadcast_to(weights, codes.shape)
+    if histogram_width(num_codes, n_candidates) < num_codes:
+        if weights is not None:
+            order = np.argsort(codes, axis=1)
+            codes = np.take_along_axis(codes, order, axis=1)
+            weights = np.take_along_axis(weights, order, axis=1)
+        else:
+            codes = np.sort(codes, axis=1)
+        new_bucket = np.ones(codes.shape, dtype=bool)
+        new_bucket[:, 1:] = codes[:, 1:] != codes[:, :-1]
+        buckets = np.cumsum(new_bucket, axis=1) - 1
+        num_codes = n_candidates
+    else:
+        buckets = codes
+    offsets = np.arange(n_guesses, dtype=np.int64)[:, None] * num_codes
+    weights = weights.ravel() if weights is not None else None
+    counts = np.bincount((buckets + offsets).ravel(), weights=weights, minlength=n_guesses * num_codes)
+    return counts.reshape(n_guesses, num_codes)
+
+
+def board_histograms(codes, num_codes, boards, num_boards, weights=None):
+    """
+    Counts the feedback buckets of every guess separately for each board, in one bincount.
+    :param codes: (guesses, candidates) feedback codes against the concatenated candidates of all boards.
+    :param boards: Board index of every candidate column.
+    :param weights: Optional prior weight of every candidate column.
+    :return: (guesses, num_boards, num_codes) array of bucket sizes.
+    """
+    n_guesses = codes.shape[0]
+    width = num_boards * num_codes
+    offsets = np.arange(n_guesses, dtype=np.int64)[:, None] * width + boards * num_codes
+    weights = np.broadcast_to(weights, codes.shape).ravel() if weights is not None else None
+    counts = np.bincount((codes + offsets).ravel(), weights=weights, minlength=n_guesses * width)
+    return counts.reshape(n_guesses, num_boards, num_codes)
+
+
+def histogram_width(num_codes, n_candidates):
+    """
+    Number of columns feedback_histograms returns.
+    """
+    return n_candidates if 4 * n_candidates < num_codes else num_codes
+
+
+class GuessStrategy:
+    """
+    Base class for guess strategies. Subclasses implement score(), higher is better.
+    """
+    name = "base"
+
+    def __init__(self, block_size=2048):
+        self.block_size = block_size
+        self.opening_guess = None
+        # Number of excluded guesses when the opening was scored, a new exclusion invalidates it
+        self.opening_excluded = 0
+
+    def score(self, counts: np.ndarray, n_candidates) -> np.ndarray:
+        """
+        :param counts: Bucket sizes, buckets on the last axis. Summed prior weights (floats) when weighted.
+        :param n_candidates: Candidate count, or one count per board broadcasting against counts.sum(axis=-1).
+            The total weight when weighted.
+        """
+        raise NotImplementedError
+
+    def score_all(self, feedback_matrix, candidates, weights=None) -> np.ndarray:
+        """
+        Scores every allowed guess against the candidates, in blocks of guesses to bound memory.
+        :param weights: Optional prior weight of every candidate.
+        """
+        n_guesses = len(feedback_matrix.guesses)
+        num_codes = 3 ** feedback_matrix.word_length
+        width = max(histogram_width(num_codes, len(candidates)), len(candidates))
+        block_size = max(1, min(self.block_size, MAX_HISTOGRAM_CELLS // max(width, 1)))
+        total = len(candidates) if weights is None else weights.sum()
+        scores = np.empty(n_guesses, dtype=np.float64)
+        for start in range(0, n_guesses, block_size):
+            block = slice(start, start + block_size)
+            counts = feedback_histograms(feedback_matrix.block(block, candidates), num_codes, weights)
+            scores[block] = self.score(counts, total)
+        return scores
+
+    @staticmethod
+    def is_opening(feedback_matrix, candidates, excluded=None) -> bool:
+        """
+        True when the candidates are every answer that was not excluded, the position every game starts from.
+        """
+        excluded_answers = int(feedback_matrix.guess_is_answer[excluded].sum()) if excluded is not None else 0
+        return len(candidates) + excluded_answers == len(feedback_matrix.answers)
+
+    def choose(self, feedback_matrix, candidates, weights=None, excluded=None) -> str:
+        """
+        Returns the best scoring guess, preferring guesses that could still be the answer on ties.
+        :param weights: Optional prior weight of every candidate, None when they are equally likely.
+        :param excluded: Optional guess rows that must not be played, e.g. the guesses the game refused.
+            Excluded answers must already be missing from the candidates.
+        """
+        if len(candidates) <= 2:
+            # Guessing the likeliest candidate maximizes the chance of winning right away
+            return feedback_matrix.answers[candidates[np.argmax(weights) if weights is not None else 0]]
+        # The opening position is the same every game so it is only scored once, and again after an exclusion
+        n_excluded = len(excluded) if excluded is not None else 0
+        opening = self.is_opening(feedback_matrix, candidates, excluded)
+        if opening and self.opening_guess is not None and self.opening_excluded == n_excluded:
+            return self.opening_guess
+        scores = self.score_all(feedback_matrix, candidates, weights)
+        if n_excluded:
+            scores[excluded] = -np.inf
+        guess = self.best_guess(feedback_matrix, scores, candidates, weights)
+        if opening:
+            self.opening_guess = guess
+            self.opening_excluded = n_excluded
+        return guess
+
+    @staticmethod
+    def best_guess(feedback_matrix, scores, candidates, weights=None) -> str:
+        """
+        Returns the best scoring guess, preferring guesses that are one of the candidates on ties,
+        the likeliest one when weights are given.
+        """
+        prior = np.zeros(len(feedback_matrix.guesses), dtype=np.float64)
+        answer_rows = [feedback_matrix.guess_index[feedback_matrix.answers[i]] for i in candidates]
+        prior[answer_rows] = weights if weights is not None else 1.0
+        best = scores.max()
+        tied = np.flatnonzero(scores >= best - 1e-9)
+        return feedback_matrix.guesses[tied[np.argmax(prior[tied])]]
+
+    def score_boards(self, feedback_matrix, candidate_sets, weight_sets=None) -> np.ndarray:
+        """
+        Scores every allowed guess by its summed score over several boards, histogramming all boards at once.
+        :param weight_sets: Optional prior weights of the candidates of every board.
+        """
+        n_guesses = len(feedback_matrix.guesses)
+        num_codes = 3 ** feedback_matrix.word_length
+        num_boards = len(candidate_sets)
+        n_candidates = np.array([len(candidates) for candidates in candidate_sets])
+        candidates = np.concatenate(candidate_sets)
+        boards = np.repeat(np.arange(num_boards), n_candidates)
+        weights = None
+        if weight_sets is not None:
+            weights = np.concatenate(weight_sets)
+            n_candidates = np.array([board_weights.sum() for board_weights in weight_sets])
+        block_size = max(1, min(self.block_size, MAX_HISTOGRAM_CELLS // (num_boards * num_codes)))
+        scores = np.empty(n_guesses, dtype=np.float64)
+        for start in range(0, n_guesses, block_size):
+            block = slice(start, start + block_size)
+            counts = board_histograms(feedback_matrix.block(block, candidates), num_codes, boards, num_boards, weights)
+            scores[block] = self.score(counts, n_candidates).sum(axis=1)
+        return scores
+
+    def choose_boards(self, feedback_matrix, candidate_sets, weight_sets=None, excluded=None) -> str:
+        """
+        Returns the best guess for several boards played at once, given the candidates of every unsolved board.
+        A board down to one candidate is solved right away.
+        :param weight_sets: Optional prior weights of the candidates of every board.
+        :param excluded: Optional guess rows that must not be played, see choose.
+        """
+        for candidates in candidate_sets:
+            if len(candidates) == 1:
+                return feedback_matrix.answers[candidates[0]]
+        first_weights = weight_sets[0] if weight_sets is not None else None
+        if len(candidate_sets) == 1:
+            return self.choose(feedback_matrix, candidate_sets[0], first_weights, excluded)
+        # Every board starts from the full list, so the opening is the single board opening
+        if all(self.is_opening(feedback_matrix, candidates, excluded) for candidates in candidate_sets):
+            return self.choose(feedback_matrix, candidate_sets[0], first_weights, excluded)
+        scores = self.score_boards(feedback_matrix, candidate_sets, weight_sets)
+        if excluded is not None and len(excluded):
+            scores[excluded] = -np.inf
+        weights = np.concatenate(weight_sets) if weight_sets is not None else None
+        return self.best_guess(feedback_matrix, scores, np.concatenate(candidate_sets), weights)
+
+
+class EntropyStrategy(GuessStrategy):
+    """
+    Maximizes the expected information (in bits) of the feedback.
+    """
+    name = "entropy"
+
+    def score(self, counts, n_candidates):
+        # H = log2(n) - sum(c * log2(c)) / n, with c * log2(c) looked up instead of recomputed per bucket
+        if counts.dtype.kind == 'f':
+            # Summed weights are not table indices, compute c * log2(c) directly
+            c_log_c = counts * np.log2(np.maximum(counts, 1e-300))
+            return np.log2(n_candidates) - c_log_c.sum(axis=-1) / n_candidates
+        c = np.arange(np.max(n_candidates) + 1, dtype=np.float64)
+        c_log_c = c * np.log2(np.maximum(c, 1))
+        return np.log2(n_candidates) - c_log_c[counts].sum(axis=-1) / n_candidates
+
+
+class ExpectedRemainingStrategy(GuessStrategy):
+    """
+    Minimizes the expected number of candidates left after the feedback.
+    """
+    name = "expected"
+
+    def score(self, counts, n_candidates):
+        return -(counts.astype(np.float64) ** 2).sum(axis=-1) / n_candidates
+
+
+class WorstCaseStrategy(GuessStrategy):
+    """
+    Minimizes the size of the largest feedback bucket.
+    """
+    name = "worst_case"
+
+    def score(self, counts, n_candidates):
+        return -counts.max(axis=-1).astype(np.float64)
+
+
+class RandomStrategy(GuessStrategy):
+    """
+    Baseline: a random remaining candidate, drawn by prior weight when weights are given.
+    """
+    name = "random"
+
+    def choose(self, feedback_matrix, candidates, weights=None, excluded=None):
+        # Only candidates are played, and excluded answers are no longer candidates
+        if weights is None:
+            return feedback_matrix.answers[random.choice(candidates)]
+        return feedback_matrix.answers[random.choices(candidates, weights=weights)[0]]
+
+    def choose_boards(self, feedback_matrix, candidate_sets, weight_sets=None, excluded=None):
+        board = random.randrange(len(candidate_sets))
+        return self.choose(feedback_matrix, candidate_sets[board], weight_sets[board] if weight_sets is not None else None)
+
+
+STRATEGIES = {
+    strategy.name: strategy
+    for strategy in (EntropyStrategy, ExpectedRemainingStrategy, WorstCaseStrategy, RandomStrategy)
+}
+
+
+def get_strategy(name: str) -> GuessStrategy:
+    """
+    Creates a new strategy instance by name.
+    """
+    if name not in STRATEGIES:
+        raise ValueError(f"Unknown strategy '{name}'. Available: {', '.join(STRATEGIES)}")
+    return STRATEGIES[name]()
@@ -0,0 +1,218 @@
+"""
+Long-running browser play that survives failures.
+One Playwright browser and one solver live for the whole run. When a game fails only the game's context and page
+are replaced, the browser is relaunched only if it died, and the solver keeps its word list and matrices.
+Recoveries are spaced by an exponential backoff that resets after every completed game.
+Health and throughput counters are kept in a utils.instrumentation.Metrics, printed every report interval and
+exported with --metrics.
+
+Usage:
+    python wordle_solver/supervisor.py --word-list wordle_solver/utils/self_creating_list.txt --metrics metrics.prom
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from playwright.sync_api import sync_playwright
+
+from browser.wordle_game import WordleGame
+from solvers.algo_solver_v1 import algoSolverV1
+from utils.game_history import GameHistory
+from utils.instrumentation import Metrics
+from utils.packed_word_list import load_packed_word_list
+
+
+class Supervisor:
+    def __init__(self, word_list_path, headless=True, max_guesses=6, metrics=None, base_backoff=1.0, max_backoff=60.0,
+                 max_consecutive_failures=None, report_interval=60.0, **solver_kwargs):
+        """
+        :param metrics: Metrics receiving the solver and supervisor counters, an unexported one when None.
+        :param base_backoff: Seconds waited before the first recovery, doubled after every further failure in a row.
+        :param max_backoff: Upper bound of the backoff.
+        :param max_consecutive_failures: Failures in a row after which the last error is raised, never when None.
+        :param report_interval: Seconds between two printed health reports, 0 to disable them.
+        Other keyword arguments are passed to algoSolverV1.
+        """
+        self.word_list_path = word_list_path
+        self.headless = headless
+        self.max_guesses = max_guesses
+        self.metrics = metrics if metrics is not None else Metrics()
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.max_consecutive_failures = max_consecutive_failures
+        self.report_interval = report_interval
+        self.solver_kwargs = solver_kwargs
+        self.playwright = None
+        self.browser = None
+        self.game = None
+        self.solver = None
+        self.game_ready = False
+        self.consecutive_failures = 0
+        self.started = time.time()
+        self.last_game_time = None
+        self.last_report = time.perf_counter()
+
+    def start(self):
+        """
+        Launches the browser and creates the game and the solver, the game page is opened by the run loop.
+        """
+        self.playwright = sync_playwright().start()
+        self.launch_browser()
+        word_length = load_packed_word_list(self.word_list_path).word_length
+        self.game = WordleGame(headless=self.headless, max_rows=self.max_guesses, word_length=word_length, browser=self.browser)
+        self.solver = algoSolverV1(self.word_list_path, game=self.game, metrics=self.metrics, **self.solver_kwargs)
+
+    def launch_browser(self):
+        if self.browser is not None:
+            try:
+                self.browser.close()
+            except Exception:
+                pass
+        self.browser = self.playwright.chromium.launch(headless=self.headless)
+        if self.game is not None:
+            self.game.browser = self.browser
+
+    def backoff_delay(self) -> float:
+        if not self.consecutive_failures:
+            return 0.0
+        return min(self.base_backoff * 2 ** (self.consecutive_failures - 1), self.max_backoff)
+
+    def open_game(self):
+        """
+        Opens a fresh game page, after the backoff delay when recovering from a failure.
+        """
+        delay = self.backoff_delay()
+        if delay:
+            self.log(f"Recovering in {delay:.1f}s (failure {self.consecutive_failures} in a row).")
+            time.sleep(delay)
+        if not self.browser.is_connected():
+            self.launch_browser()
+            self.metrics.count("browser_restarts")
+        self.solver.reset_state()
+        if self.game.context is None:
+            self.game.start()
+        else:
+            self.game.recycle()
+            self.metrics.count("context_recycles")
+        self.game_ready = True
+
+    def play_game(self):
+        """
+        Plays one game and restarts the page for the next one.
+        """
+        start = time.perf_counter()
+        self.solver.solve(self.game)
+        self.solver.restart_game(self.game)
+        self.metrics.observe("game_seconds", time.perf_counter() - start)
+        self.last_game_time = time.time()
+        self.consecutive_failures = 0
+
+    def run(self, max_games=None):
+        """
+        Plays games until max_games complete (forever when None), recovering from every failure.
+        """
+        self.start()
+        try:
+            while max_games is None or self.metrics.counters.get("games", 0) < max_games:
+                try:
+                    if not self.game_ready:
+                        self.open_game()
+                    self.play_game()
+                except Exception as e:
+                    if not self.headless and not self.browser.is_connected():
+                        print("You closed the game window. Exiting with no game restart...")
+                        return
+                    self.game_ready = False
+                    self.consecutive_failures += 1
+                    self.metrics.count("failures")
+                    self.log(f"Error: {e}")
+                    if self.max_consecutive_failures and self.consecutive_failures >= self.max_consecutive_failures:
+                        raise
+                self.maybe_report()
+        finally:
+            self.close()
+
+    def log(self, message):
+        """
+        Sends a message to the solver's dashboard, or prints it when the dashboard is disabled.
+        """
+        if self.solver.dashboard.enabled:
+            self.solver.log(message)
+        else:
+            print(message)
+
+    def health(self) -> dict:
+        """
+        Snapshot of the liveness and throughput counters.
+        """
+        counters = self.metrics.counters
+        uptime = time.time() - self.started
+        games = counters.get("games", 0)
+        return {
+            "status": "ok" if not self.consecutive_failures else "recovering",
+            "uptime_seconds": uptime,
+            "games": games,
+            "wins": counters.get("win", 0),
+            "losses": counters.get("lost", 0),
+            "games_per_hour": games * 3600 / uptime if uptime else 0.0,
+            "seconds_since_last_game": time.time() - self.last_game_time if self.last_game_time else None,
+            "failures": counters.get("failures", 0),
+            "consecutive_failures": self.consecutive_failures,
+            "context_recycles": counters.get("context_recycles", 0),
+            "browser_restarts": counters.get("browser_restarts", 0),
+            # Which page signal ended the wait after each guess, "timeout" means the full delay was waited
+            "reveal_signals": dict(self.game.reveal_signals) if self.game is not None else {},
+        }
+
+    def maybe_report(self):
+        if self.report_interval and time.perf_counter() - self.last_report >= self.report_interval:
+            self.last_report = time.perf_counter()
+            health = self.health()
+            self.log(
+                f"[{health['status']}] {health['games']} games ({health['wins']} won) at {health['games_per_hour']:.0f}/h, "
+                f"{health['failures']} failures, {health['context_recycles']} recycles, {health['browser_restarts']} browser restarts"
+            )
+
+    def close(self):
+        if self.solver is not None:
+            self.solver.close()
+        if self.browser is not None:
+            try:
+                self.browser.close()
+            except Exception:
+                pass
+        if self.playwright is not None:
+            self.playwright.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play Wordle Unlimited forever, recovering from browser failures.")
+    parser.add_argument("--word-list", default="wordle_solver/utils/self_creating_list.txt")
+    parser.add_argument("--strategy", default="random")
+    parser.add_argument("--games", type=int, default=None, help="Stop after this many games, plays forever when omitted.")
+    parser.add_argument("--headed", action="store_true")
+    parser.add_argument("--display", action="store_true", help="Show the live dashboard.")
+    parser.add_argument("--metrics", default=None, help="Export the metrics to this file, Prometheus format if it ends in .prom.")
+    parser.add_argument("--max-backoff", type=float, default=60.0)
+    parser.add_argument("--history", default=None, help="Record every game into this game history database.")
+    args = parser.parse_args()
+    metrics = Metrics(export_path=args.metrics,
+                      export_format="prometheus" if args.metrics and args.metrics.endswith(".prom") else "jsonl")
+    # A browser game takes seconds, inserting often costs nothing and a crash loses at most the last few games
+    history = GameHistory(args.history, batch_size=10, flush_interval=30.0) if args.history else None
+    supervisor = Supervisor(args.word_list, headless=not args.headed, metrics=metrics, max_backoff=args.max_backoff,
+                            strategy=args.strategy, display=args.display, history=history)
+    try:
+        supervisor.run(max_games=args.games)
+    finally:
+        if history is not None:
+            history.close()
+    print(supervisor.health())
+
+
+if __name__ == "__main__":
+    main()
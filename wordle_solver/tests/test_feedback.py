@@ -0,0 +1,70 @@
+"""
+Checks the vectorized feedback and the bitset filter against the reference implementations,
+on word sets full of repeated letters where the yellow counting is easy to get wrong.
+"""
+
+import os
+import random
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.tile import code_to_states
+from solvers.candidate_index import CandidateIndex
+from solvers.feedback_matrix import FeedbackMatrix, compute_feedback_block, encode_feedback, words_to_array
+
+REPEATED_WORDS = ["EERIE", "GEESE", "SPEED", "ABBEY", "LLAMA", "MAMMA", "EASEL", "ERASE", "SEEDS", "ALLEE", "AAAAA", "BABES"]
+
+
+def repeated_letter_words(count=60, seed=0):
+    """
+    Hand picked words with repeated letters plus random words over a three letter alphabet.
+    """
+    rng = random.Random(seed)
+    words = set(REPEATED_WORDS)
+    while len(words) < count:
+        words.add("".join(rng.choice("ABE") for _ in range(5)))
+    return sorted(words)
+
+
+def test_compute_feedback_block_matches_encode_feedback():
+    words = repeated_letter_words()
+    codes = compute_feedback_block(words_to_array(words), words_to_array(words))
+    expected = np.array([[encode_feedback(guess, answer) for answer in words] for guess in words])
+    assert np.array_equal(codes, expected)
+
+
+def test_encode_feedback_repeated_letters():
+    # Only one E of the guess is unmatched in the answer, the leftmost one gets the yellow
+    assert code_to_states(encode_feedback("EERIE", "SPEED"), 5) == ["present", "present", "absent", "absent", "absent"]
+    assert code_to_states(encode_feedback("SPEED", "ABIDE"), 5) == ["absent", "absent", "present", "absent", "present"]
+
+
+def test_bitset_filter_matches_matrix_filter():
+    words = repeated_letter_words()
+    matrix = FeedbackMatrix(words, words, cache_dir=None)
+    index = CandidateIndex(words)
+    candidates = matrix.all_candidates()
+    for guess in words:
+        for secret in words:
+            code = encode_feedback(guess, secret)
+            expected = matrix.filter(candidates, guess, code)
+            mask = index.apply_feedback(index.all_bits, guess, code_to_states(code, len(guess)))
+            assert np.array_equal(index.indices(mask), expected), (guess, secret)
+
+
+def test_bitset_filter_matches_matrix_filter_over_several_rows():
+    words = repeated_letter_words(seed=1)
+    matrix = FeedbackMatrix(words, words, cache_dir=None)
+    index = CandidateIndex(words)
+    rng = random.Random(1)
+    for secret in words:
+        candidates = matrix.all_candidates()
+        mask = index.all_bits
+        for guess in rng.sample(words, 3):
+            code = encode_feedback(guess, secret)
+            candidates = matrix.filter(candidates, guess, code)
+            mask = index.apply_feedback(mask, guess, code_to_states(code, len(guess)))
+            assert np.array_equal(index.indices(mask), candidates), (guess, secret)
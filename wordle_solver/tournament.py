@@ -0,0 +1,212 @@
+"""
+Plays several solvers side by side against the same secret words on the offline simulator.
+Every worker process plays each secret with every solver, so all of them see the identical sequence of games,
+and the reports compare their guess distributions and decision latencies.
+The feedback matrix is built once in the parent process, copied into shared memory and attached read-only by the
+workers (FeedbackMatrix.share / attach), so no worker loads or builds its own copy.
+
+Solvers are strategy names (see solvers.strategies.STRATEGIES) played by a CandidateSolver, or "module:ClassName" specs
+of solvers.base_solver.Solver subclasses, constructed as ClassName(word_list_path, feedback_matrix=feedback_matrix).
+
+Usage:
+    python wordle_solver/tournament.py entropy expected worst_case random --limit 500
+    python wordle_solver/tournament.py entropy my_solvers.greedy:GreedySolver --output tournament.json
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark import summarize
+from simulator.simulated_wordle_game import SimulatedWordleGame
+from solvers.base_solver import load_solver_class
+from solvers.candidate_solver import CandidateSolver
+from solvers.feedback_matrix import DEFAULT_ANSWER_LIST_PATH, DEFAULT_GUESS_LIST_PATH, FeedbackMatrix, read_words
+from solvers.strategies import get_strategy
+from utils.packed_word_list import load_packed_word_list
+
+# The game and the solvers of each worker process, created by init_worker
+worker_game = None
+worker_solvers = None
+
+
+def create_game(config):
+    return SimulatedWordleGame(
+        allowed_words=read_words(config["guess_list_path"]) + read_words(config["solution_list_path"]),
+        secret_words=read_words(config["solution_list_path"]),
+        max_rows=config.get("max_guesses") or 6,
+    )
+
+
+def create_solver(spec, config, game, feedback_matrix):
+    if ":" in spec:
+        return load_solver_class(spec)(config["word_list_path"], feedback_matrix=feedback_matrix)
+    return CandidateSolver(
+        config["word_list_path"],
+        feedback_matrix=feedback_matrix,
+        engine=config["engine"],
+        strategy=spec,
+        guess_list_path=config["guess_list_path"],
+        priors=config.get("priors", True),
+        max_guesses=game.board.max_rows,
+    )
+
+
+def check_spec(spec):
+    """
+    Raises ValueError for an unknown solver spec before any worker starts.
+    """
+    if ":" in spec:
+        load_solver_class(spec)
+    else:
+        get_strategy(spec)
+
+
+def init_worker(config, specs, guesses, answers, shared_memory_name):
+    global worker_game, worker_solvers
+    if shared_memory_name is not None:
+        feedback_matrix = FeedbackMatrix.attach(guesses, answers, shared_memory_name)
+    else:
+        feedback_matrix = FeedbackMatrix.from_packed(config["guess_list_path"], load_packed_word_list(config["word_list_path"]))
+    worker_game = create_game(config)
+    worker_solvers = {spec: create_solver(spec, config, worker_game, feedback_matrix) for spec in specs}
+
+
+def play(solver, game, secret):
+    """
+    Plays one game through the Solver interface.
+    :return: Dictionary with the guesses, result and decision latencies of the game.
+    """
+    solver.reset()
+    game.restart(secret=secret)
+    decision_times = []
+    # Refused guesses do not use a row, bound the turns so a solver repeating one cannot loop forever
+    for _ in range(4 * game.board.max_rows):
+        if game.game_state != 'running':
+            break
+        start = time.perf_counter()
+        guess = solver.next_guess()
+        decision_times.append(time.perf_counter() - start)
+        if guess is None:
+            break
+        row_index = len(game.board)
+        game.type_word(guess)
+        game.update_game_state()
+        if len(game.board) > row_index:
+            solver.observe(game.board.words[row_index], game.board.codes[row_index])
+        elif game.game_state == 'running':
+            solver.reject(guess)
+    return {
+        "secret": secret,
+        "won": game.game_state == "win",
+        "guesses": game.board.words[:len(game.board)],
+        "decision_times": decision_times,
+    }
+
+
+def play_round(secret):
+    """
+    Plays the secret with every solver of the worker, each seeded the same way for every run.
+    """
+    results = {}
+    for spec, solver in worker_solvers.items():
+        random.seed(secret)
+        results[spec] = play(solver, worker_game, secret)
+    return results
+
+
+def head_to_head(games_by_solver, max_guesses):
+    """
+    Counts for every pair of solvers the games each needed fewer guesses for, a lost game counting max_guesses + 1.
+    """
+    def score(game):
+        return len(game["guesses"]) if game["won"] else max_guesses + 1
+
+    results = {}
+    for a, b in combinations(games_by_solver, 2):
+        a_wins = b_wins = 0
+        for game_a, game_b in zip(games_by_solver[a], games_by_solver[b]):
+            a_wins += score(game_a) < score(game_b)
+            b_wins += score(game_b) < score(game_a)
+        results[f"{a} vs {b}"] = {a: a_wins, b: b_wins, "ties": len(games_by_solver[a]) - a_wins - b_wins}
+    return results
+
+
+def run_tournament(config, specs, workers=None, limit=None):
+    """
+    Plays every solution word once with every solver and returns the tournament report.
+    """
+    for spec in specs:
+        check_spec(spec)
+    secrets = read_words(config["solution_list_path"])[:limit]
+    workers = workers or os.cpu_count() or 1
+    feedback_matrix = FeedbackMatrix.from_packed(config["guess_list_path"], load_packed_word_list(config["word_list_path"]))
+    block = feedback_matrix.share() if not feedback_matrix.lazy else None
+    start = time.perf_counter()
+    try:
+        initargs = (config, specs, feedback_matrix.guesses, feedback_matrix.answers, block.name if block else None)
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=initargs) as executor:
+            rounds = list(executor.map(play_round, secrets, chunksize=max(1, len(secrets) // (workers * 8))))
+    finally:
+        if block is not None:
+            block.close()
+            block.unlink()
+    elapsed = time.perf_counter() - start
+    games_by_solver = {spec: [results[spec] for results in rounds] for spec in specs}
+    return {
+        "config": config,
+        "solvers": specs,
+        "workers": workers,
+        "elapsed_seconds": elapsed,
+        "summaries": {spec: summarize(games) for spec, games in games_by_solver.items()},
+        "head_to_head": head_to_head(games_by_solver, config.get("max_guesses") or 6),
+        "games": games_by_solver,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare Wordle solvers on the same secret words.")
+    parser.add_argument("solvers", nargs="+", help="Strategy names or module:ClassName Solver specs.")
+    parser.add_argument("--engine", default="matrix", choices=["dict", "matrix", "bitset"])
+    parser.add_argument("--word-list", default=DEFAULT_ANSWER_LIST_PATH, help="Word list the solvers load.")
+    parser.add_argument("--solution-list", default=DEFAULT_ANSWER_LIST_PATH, help="Secret words to play against.")
+    parser.add_argument("--guess-list", default=DEFAULT_GUESS_LIST_PATH, help="Words the game accepts as guesses.")
+    parser.add_argument("--max-guesses", type=int, default=None, help="Guesses allowed per game, defaults to 6.")
+    parser.add_argument("--no-priors", action="store_true", help="Treat every word of the word list as equally likely.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes, defaults to the core count.")
+    parser.add_argument("--limit", type=int, default=None, help="Only play the first N solution words.")
+    parser.add_argument("--output", default="tournament_results.json")
+    args = parser.parse_args()
+
+    config = {
+        "engine": args.engine,
+        "word_list_path": args.word_list,
+        "solution_list_path": args.solution_list,
+        "guess_list_path": args.guess_list,
+        "max_guesses": args.max_guesses,
+        "priors": not args.no_priors,
+    }
+    report = run_tournament(config, args.solvers, workers=args.workers, limit=args.limit)
+    with open(args.output, 'w') as file:
+        json.dump(report, file, indent=2)
+
+    print(f"Games: {len(report['games'][args.solvers[0]])} per solver in {report['elapsed_seconds']:.1f}s with {report['workers']} workers")
+    print(f"{'solver':<24} {'win %':>7} {'mean':>6} {'p50 ms':>8} {'p99 ms':>8}  histogram")
+    for spec, summary in report["summaries"].items():
+        latency = summary["decision_latency_ms"]
+        mean = f"{summary['mean_guesses']:.3f}" if summary["mean_guesses"] is not None else "-"
+        print(f"{spec:<24} {summary['win_rate']:>7.2f} {mean:>6} {latency.get('p50', 0):>8.2f} {latency.get('p99', 0):>8.2f}  {summary['histogram']}")
+    for pair, result in report["head_to_head"].items():
+        print(f"{pair}: {result}")
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
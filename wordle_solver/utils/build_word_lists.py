@@ -0,0 +1,364 @@
+"""
+Word list build pipeline.
+A build streams a source through the normalize, dedupe and frequency-annotate stages and emits a text list
+(one lower case word per line), its packed binary copy (.wlp) and, when annotated, a word<TAB>frequency table (.freq).
+Every stage writes its output to the cache directory and is recorded in a manifest together with the content hash
+of its input and parameters, so running a build again skips every stage whose input has not changed.
+
+Sources:
+    random   every combination of `length` letters, generated in parallel by prefix and written in bulk
+    english  NLTK's English word corpus, only downloaded when missing and --download is given
+    files    one or more text word lists, e.g. the word lists in wordle_solver/utils
+
+Frequencies are the number of times a word occurs across the inputs, or the counts of a word<TAB>count table
+given with --frequencies.
+
+Usage:
+    python wordle_solver/utils/build_word_lists.py random --length 5
+    python wordle_solver/utils/build_word_lists.py english --length 6 --download
+    python wordle_solver/utils/build_word_lists.py files --input a.txt b.txt --output merged.txt --frequencies counts.tsv
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import shutil
+import string
+import sys
+from multiprocessing import Pool
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.packed_word_list import PackedWordListWriter, packed_path_for
+
+UTILS_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CACHE_DIR = os.path.join(UTILS_DIR, "cache")
+MANIFEST_NAME = "word_list_manifest.json"
+# Lines per bulk write
+CHUNK_LINES = 1 << 16
+
+
+def file_hash(path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()[:16]
+
+
+def params_hash(*parts) -> str:
+    return hashlib.sha256(json.dumps(parts).encode("utf-8")).hexdigest()[:16]
+
+
+def read_lines(path):
+    """
+    Streams the lines of a file without their line breaks.
+    """
+    with open(path, 'r') as file:
+        for line in file:
+            yield line.rstrip("\n")
+
+
+def chunked(lines, size=CHUNK_LINES):
+    lines = iter(lines)
+    while True:
+        chunk = list(itertools.islice(lines, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def write_lines(path, lines):
+    """
+    Writes lines in bulk chunks to a temporary file that replaces path once complete.
+    :return: Number of lines written.
+    """
+    count = 0
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as file:
+        for chunk in chunked(lines):
+            file.write("\n".join(chunk) + "\n")
+            count += len(chunk)
+    os.replace(tmp_path, path)
+    return count
+
+
+# Sources
+
+def random_words_with_prefix(args) -> bytes:
+    """
+    Every word of the given length starting with prefix, as newline separated bytes. Runs in a worker process.
+    """
+    prefix, length = args
+    suffixes = itertools.product(string.ascii_lowercase, repeat=length - len(prefix))
+    return "".join(prefix + "".join(suffix) + "\n" for suffix in suffixes).encode("ascii")
+
+
+def generate_random_words(path, length, workers=None):
+    """
+    Writes all 26 ** length letter combinations in order, one block of 26 ** 4 words per prefix and process.
+    """
+    prefix_length = max(1, length - 4)
+    prefixes = ["".join(prefix) for prefix in itertools.product(string.ascii_lowercase, repeat=prefix_length)]
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with Pool(workers) as pool, open(tmp_path, 'wb') as file:
+        for block in pool.imap(random_words_with_prefix, [(prefix, length) for prefix in prefixes]):
+            file.write(block)
+    os.replace(tmp_path, path)
+
+
+def english_corpus(download=False):
+    """
+    NLTK's English word corpus reader, downloading the corpus first when it is missing and download is set.
+    """
+    import nltk
+    try:
+        nltk.data.find("corpora/words")
+    except LookupError:
+        if not download:
+            raise RuntimeError("The NLTK words corpus is not installed, run again with --download.")
+        nltk.download("words")
+    from nltk.corpus import words
+    return words
+
+
+def english_corpus_hash(download=False) -> str:
+    """
+    Hash of the corpus files, so a corpus update invalidates the cached source stage.
+    """
+    corpus = english_corpus(download)
+    digest = hashlib.sha256()
+    for fileid in corpus.fileids():
+        digest.update(corpus.raw(fileid).encode("utf-8"))
+    return params_hash("english", digest.hexdigest())
+
+
+def english_words(download=False):
+    """
+    Streams NLTK's English word corpus.
+    """
+    yield from english_corpus(download).words()
+
+
+def concatenate_files(path, input_paths):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as output:
+        for input_path in input_paths:
+            with open(input_path, 'rb') as file:
+                shutil.copyfileobj(file, output, 1 << 20)
+            output.write(b"\n")
+    os.replace(tmp_path, path)
+
+
+def infer_word_length(input_paths) -> int:
+    """
+    Length shared by every non-empty line of the input lists.
+    Raises ValueError when the lines have different lengths, the length must then be given explicitly.
+    """
+    lengths = set()
+    for input_path in input_paths:
+        for line in read_lines(input_path):
+            word = line.strip()
+            if word:
+                lengths.add(len(word))
+    if len(lengths) != 1:
+        found = ", ".join(map(str, sorted(lengths))) or "none"
+        raise ValueError(f"Cannot infer the word length, the input words have lengths {found}. Pass --length.")
+    return lengths.pop()
+
+
+# Stages
+
+def normalize(lines, length):
+    """
+    Lower cases words and keeps the alphabetic ASCII words of the given length.
+    """
+    for line in lines:
+        word = line.strip().lower()
+        if len(word) == length and word.isascii() and word.isalpha():
+            yield word
+
+
+def dedupe(words):
+    """
+    Drops repeated words, keeping the first occurrence order, and annotates every word with its occurrence count.
+    """
+    counts = {}
+    for word in words:
+        counts[word] = counts.get(word, 0) + 1
+    for word, count in counts.items():
+        yield f"{word}\t{count}"
+
+
+def read_frequency_table(path) -> dict:
+    """
+    Reads a word<TAB>count table, as written to .freq files.
+    """
+    table = {}
+    for line in read_lines(path):
+        word, _, count = line.partition("\t")
+        if count:
+            table[word.strip().lower()] = int(count)
+    return table
+
+
+def annotate(lines, frequencies=None):
+    """
+    Replaces the occurrence counts with the counts of a frequency table, words missing from the table get 0.
+    """
+    table = read_frequency_table(frequencies) if frequencies else None
+    for line in lines:
+        if table is None:
+            yield line
+        else:
+            word = line.partition("\t")[0]
+            yield f"{word}\t{table.get(word, 0)}"
+
+
+def emit(input_path, text_path, length, frequency_path=None):
+    """
+    Writes the text list, the packed list and optionally the frequency table in one streaming pass.
+    """
+    tmp_path = f"{text_path}.{os.getpid()}.tmp"
+    frequency_file = open(f"{frequency_path}.{os.getpid()}.tmp", 'w') if frequency_path else None
+    digest = hashlib.sha256()
+    try:
+        # newline="\n" keeps the written bytes identical to the hashed ones on every platform
+        with open(tmp_path, 'w', newline="\n") as text_file, PackedWordListWriter(packed_path_for(text_path), length) as packed:
+            for chunk in chunked(read_lines(input_path)):
+                words = [line.partition("\t")[0] for line in chunk]
+                text = "\n".join(words) + "\n"
+                text_file.write(text)
+                digest.update(text.encode("ascii"))
+                packed.write(words)
+                if frequency_file:
+                    frequency_file.write("\n".join(chunk) + "\n")
+            packed.text_digest = digest.digest()
+    finally:
+        if frequency_file:
+            frequency_file.close()
+    os.replace(tmp_path, text_path)
+    if frequency_path:
+        os.replace(f"{frequency_path}.{os.getpid()}.tmp", frequency_path)
+
+
+class WordListBuild:
+    """
+    Runs the stages of one named build, skipping the stages whose recorded input hash still matches and whose
+    outputs are unchanged on disk.
+    """
+    def __init__(self, name, cache_dir=DEFAULT_CACHE_DIR):
+        self.name = name
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+        self.manifest_path = os.path.join(cache_dir, MANIFEST_NAME)
+        self.manifest = {}
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, 'r') as file:
+                self.manifest = json.load(file)
+
+    def stage_path(self, stage_name):
+        return os.path.join(self.cache_dir, f"{self.name}.{stage_name}.txt")
+
+    def stage(self, stage_name, input_key, run, outputs=None):
+        """
+        Runs run() unless the stage already ran on the same input.
+        :param input_key: Hash of everything the stage output depends on.
+        :param run: Callable writing the outputs.
+        :param outputs: Files written by run, a single cache file by default.
+        :return: Hash of the first output, the input key of the next stage.
+        """
+        outputs = outputs or [self.stage_path(stage_name)]
+        entry = self.manifest.get(self.name, {}).get(stage_name)
+        if (entry and entry["input"] == input_key and all(os.path.exists(path) for path in outputs)
+                and [file_hash(path) for path in outputs] == entry["outputs"]):
+            print(f"[{self.name}] {stage_name}: unchanged, skipped")
+            return entry["outputs"][0]
+        print(f"[{self.name}] {stage_name}: running")
+        run()
+        output_hashes = [file_hash(path) for path in outputs]
+        self.manifest.setdefault(self.name, {})[stage_name] = {"input": input_key, "outputs": output_hashes}
+        self.save_manifest()
+        return output_hashes[0]
+
+    def save_manifest(self):
+        tmp_path = f"{self.manifest_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as file:
+            json.dump(self.manifest, file, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def run(self, source_key, write_source, length, output_path, clean=True, frequencies=None):
+        """
+        Runs the whole pipeline.
+        :param source_key: Hash identifying the source content.
+        :param write_source: Callable writing the raw source lines to the given path.
+        :param clean: Run the normalize, dedupe and annotate stages, a generated source that is already
+            normalized and unique goes straight to emit.
+        :param frequencies: Optional word<TAB>count table for the annotate stage.
+        """
+        current = self.stage_path("source")
+        key = self.stage("source", source_key, lambda: write_source(current))
+        frequency_path = None
+        if clean:
+            source_path, current = current, self.stage_path("normalize")
+            key = self.stage("normalize", params_hash(key, length),
+                             lambda: write_lines(current, normalize(read_lines(source_path), length)))
+            normalized_path, current = current, self.stage_path("dedupe")
+            key = self.stage("dedupe", params_hash(key), lambda: write_lines(current, dedupe(read_lines(normalized_path))))
+            deduped_path, current = current, self.stage_path("annotate")
+            frequency_key = file_hash(frequencies) if frequencies else None
+            key = self.stage("annotate", params_hash(key, frequency_key),
+                             lambda: write_lines(current, annotate(read_lines(deduped_path), frequencies)))
+            frequency_path = os.path.splitext(output_path)[0] + ".freq"
+        outputs = [output_path, packed_path_for(output_path)] + ([frequency_path] if frequency_path else [])
+        self.stage("emit", params_hash(key, os.path.abspath(output_path)),
+                   lambda: emit(current, output_path, length, frequency_path), outputs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build word lists with a cached, streaming pipeline.")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
+    sources = parser.add_subparsers(dest="source", required=True)
+    random_parser = sources.add_parser("random", help="Every combination of LENGTH letters.")
+    random_parser.add_argument("--length", type=int, default=5)
+    random_parser.add_argument("--workers", type=int, default=None, help="Generator processes, defaults to the core count.")
+    random_parser.add_argument("--output", default=None)
+    english_parser = sources.add_parser("english", help="English words from the NLTK corpus.")
+    english_parser.add_argument("--length", type=int, default=5)
+    english_parser.add_argument("--download", action="store_true", help="Download the NLTK corpus when missing.")
+    english_parser.add_argument("--frequencies", default=None)
+    english_parser.add_argument("--output", default=None)
+    files_parser = sources.add_parser("files", help="Merge text word lists.")
+    files_parser.add_argument("--input", nargs="+", required=True)
+    files_parser.add_argument("--length", type=int, default=None,
+                              help="Defaults to the length of the input words, which must then all have the same length.")
+    files_parser.add_argument("--frequencies", default=None)
+    files_parser.add_argument("--output", required=True)
+    args = parser.parse_args()
+
+    if args.source == "random":
+        output = args.output or os.path.join(UTILS_DIR, f"all_{args.length}_letter_words.txt")
+        build = WordListBuild(os.path.splitext(os.path.basename(output))[0], args.cache_dir)
+        build.run(params_hash("random", args.length),
+                  lambda path: generate_random_words(path, args.length, args.workers),
+                  args.length, output, clean=False)
+    elif args.source == "english":
+        output = args.output or os.path.join(UTILS_DIR, f"all_en_{args.length}_letter_words.txt")
+        build = WordListBuild(os.path.splitext(os.path.basename(output))[0], args.cache_dir)
+        build.run(english_corpus_hash(args.download),
+                  lambda path: write_lines(path, english_words(args.download)),
+                  args.length, output, frequencies=args.frequencies)
+    else:
+        output = args.output
+        length = args.length or infer_word_length(args.input)
+        build = WordListBuild(os.path.splitext(os.path.basename(output))[0], args.cache_dir)
+        build.run(params_hash("files", [file_hash(path) for path in args.input]),
+                  lambda path: concatenate_files(path, args.input),
+                  length, output, frequencies=args.frequencies)
+    print(f"Built {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+Persistent history of every played game in a local SQLite database.
+Games are buffered and inserted in batches of one transaction each, the database runs in WAL mode so reports can be
+queried while solvers keep recording. One row is stored per game, with the guesses and their feedback codes packed
+as text, and the columns the reports group by are covered by indexes so the reports only scan an index even with
+millions of games.
+
+Usage:
+    python wordle_solver/utils/game_history.py hardest --limit 20
+    python wordle_solver/utils/game_history.py openings --strategy entropy
+    python wordle_solver/utils/game_history.py trend --bucket day
+"""
+
+import argparse
+import os
+import sqlite3
+import time
+
+DEFAULT_HISTORY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "game_history.sqlite")
+TREND_BUCKETS = {"hour": 3600, "day": 86400, "week": 7 * 86400}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    played_at REAL NOT NULL,
+    strategy TEXT,
+    secret TEXT,
+    won INTEGER NOT NULL,
+    guess_count INTEGER NOT NULL,
+    opening TEXT,
+    guesses TEXT NOT NULL,
+    feedback TEXT NOT NULL,
+    rejected TEXT NOT NULL,
+    decision_ms REAL,
+    max_decision_ms REAL
+);
+CREATE INDEX IF NOT EXISTS games_secret ON games (secret, strategy, won, guess_count);
+CREATE INDEX IF NOT EXISTS games_strategy ON games (strategy, played_at, won, guess_count);
+CREATE INDEX IF NOT EXISTS games_opening ON games (opening, strategy, won, guess_count);
+CREATE INDEX IF NOT EXISTS games_played_at ON games (played_at, strategy, won, guess_count);
+"""
+
+INSERT = """
+INSERT INTO games (played_at, strategy, secret, won, guess_count, opening, guesses, feedback, rejected, decision_ms, max_decision_ms)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+class GameHistory:
+    def __init__(self, path=DEFAULT_HISTORY_PATH, batch_size=100, flush_interval=None):
+        """
+        :param path: SQLite database file, created with its schema if missing.
+        :param batch_size: Games buffered before they are inserted in one transaction.
+        :param flush_interval: Seconds after which the buffer is inserted even when the batch is not full, bounding
+                               the games lost if the process dies. Never when None.
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.pending = []
+        self.last_flush = time.monotonic()
+        self.connection = sqlite3.connect(path, timeout=30)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+
+    def record(self, secret, guesses, codes, won, strategy=None, decision_times=(), rejected=(), played_at=None):
+        """
+        Buffers one game, the buffer is inserted once batch_size games are pending or flush_interval has passed.
+        :param secret: The answer, None when it is unknown.
+        :param guesses: Accepted guesses in order.
+        :param codes: Feedback code of every guess.
+        :param decision_times: Seconds spent choosing each guess.
+        :param rejected: Words the game refused.
+        """
+        guesses = [guess.upper() for guess in guesses]
+        decision_ms = [t * 1000 for t in decision_times]
+        self.pending.append((
+            played_at if played_at is not None else time.time(),
+            strategy,
+            secret.upper() if secret else None,
+            int(bool(won)),
+            len(guesses),
+            guesses[0] if guesses else None,
+            ",".join(guesses),
+            ",".join(str(int(code)) for code in codes),
+            ",".join(word.upper() for word in rejected),
+            sum(decision_ms) if decision_ms else None,
+            max(decision_ms) if decision_ms else None,
+        ))
+        if len(self.pending) >= self.batch_size or (
+                self.flush_interval is not None and time.monotonic() - self.last_flush >= self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        self.last_flush = time.monotonic()
+        if not self.pending:
+            return
+        with self.connection:
+            self.connection.executemany(INSERT, self.pending)
+        self.pending = []
+
+    def close(self):
+        self.flush()
+        # Refreshes the planner statistics when needed, so the reports keep picking the covering indexes
+        self.connection.execute("PRAGMA optimize")
+        self.connection.close()
+
+    def query(self, sql, params=()):
+        """
+        Runs a report query after inserting the pending games.
+        :return: List of row dictionaries.
+        """
+        self.flush()
+        cursor = self.connection.execute(sql, params)
+        columns = [column[0] for column in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor]
+
+    @staticmethod
+    def where(strategy, *conditions):
+        """
+        WHERE clause and parameters of the given conditions, plus the strategy when one is given.
+        """
+        conditions = list(conditions)
+        params = ()
+        if strategy:
+            conditions.append("strategy = ?")
+            params = (strategy,)
+        return ("WHERE " + " AND ".join(conditions) if conditions else ""), params
+
+    def hardest_words(self, limit=20, min_games=1, strategy=None):
+        """
+        Secrets with the lowest win rate, then the most guesses when won.
+        """
+        where, params = self.where(strategy, "secret IS NOT NULL")
+        return self.query(f"""
+            SELECT secret, COUNT(*) AS games, 100.0 * AVG(won) AS win_rate,
+                   AVG(CASE WHEN won THEN guess_count END) AS mean_guesses
+            FROM games {where}
+            GROUP BY secret HAVING COUNT(*) >= ?
+            ORDER BY win_rate ASC, mean_guesses DESC LIMIT ?
+        """, params + (min_games, limit))
+
+    def opening_performance(self, limit=20, min_games=1, strategy=None):
+        """
+        Opening guesses by mean guesses of the games they won.
+        """
+        where, params = self.where(strategy, "opening IS NOT NULL")
+        return self.query(f"""
+            SELECT opening, COUNT(*) AS games, 100.0 * AVG(won) AS win_rate,
+                   AVG(CASE WHEN won THEN guess_count END) AS mean_guesses
+            FROM games {where}
+            GROUP BY opening HAVING COUNT(*) >= ?
+            ORDER BY mean_guesses ASC, win_rate DESC LIMIT ?
+        """, params + (min_games, limit))
+
+    def win_rate_trend(self, bucket="day", strategy=None):
+        """
+        Win rate and mean guesses per time bucket ("hour", "day" or "week"), oldest first.
+        """
+        seconds = TREND_BUCKETS[bucket]
+        where, params = self.where(strategy)
+        return self.query(f"""
+            SELECT CAST(played_at / ? AS INTEGER) * ? AS bucket_start, COUNT(*) AS games, 100.0 * AVG(won) AS win_rate,
+                   AVG(CASE WHEN won THEN guess_count END) AS mean_guesses
+            FROM games {where}
+            GROUP BY bucket_start ORDER BY bucket_start
+        """, (seconds, seconds) + params)
+
+
+def print_rows(rows, key):
+    for row in rows:
+        mean = f"{row['mean_guesses']:.3f}" if row["mean_guesses"] is not None else "-"
+        print(f"{row[key]!s:<20} games {row['games']:>8}  win {row['win_rate']:6.2f}%  mean guesses {mean}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reports over the recorded game history.")
+    parser.add_argument("report", choices=["hardest", "openings", "trend"])
+    parser.add_argument("--db", default=DEFAULT_HISTORY_PATH)
+    parser.add_argument("--strategy", default=None, help="Only games played with this strategy.")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--min-games", type=int, default=1)
+    parser.add_argument("--bucket", default="day", choices=list(TREND_BUCKETS))
+    args = parser.parse_args()
+    history = GameHistory(args.db)
+    try:
+        if args.report == "hardest":
+            print_rows(history.hardest_words(args.limit, args.min_games, args.strategy), "secret")
+        elif args.report == "openings":
+            print_rows(history.opening_performance(args.limit, args.min_games, args.strategy), "opening")
+        else:
+            rows = history.win_rate_trend(args.bucket, args.strategy)
+            for row in rows:
+                row["bucket_start"] = time.strftime("%Y-%m-%d %H:%M", time.localtime(row["bucket_start"]))
+            print_rows(rows, "bucket_start")
+    finally:
+        history.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""
+Lightweight instrumentation for the solver loop.
+Metrics collects per-phase timers, event counters and observed values (e.g. candidate set sizes) and exports them
+as JSON lines or a Prometheus text file. NULL_METRICS has the same interface and does nothing, so an uninstrumented
+solver only pays for a method call that returns a shared no-op context manager.
+Phases are timed with the Metrics.timer context manager, or with the timed decorator for methods of objects holding
+their metrics in self.metrics.
+"""
+
+import cProfile
+import json
+import os
+import pstats
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+
+
+class Stat:
+    """
+    Running count / sum / min / max / last of a series of values.
+    """
+    __slots__ = ("count", "total", "min", "max", "last")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+        self.last = None
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        self.last = value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "mean": self.total / self.count if self.count else None,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "last": self.last,
+        }
+
+
+class Metrics:
+    enabled = True
+
+    def __init__(self, export_path=None, export_format="jsonl", export_interval=10.0, prefix="wordle_solver"):
+        """
+        :param export_path: File written by maybe_export/export, nothing is written when None.
+        :param export_format: "jsonl" appends one snapshot per line, "prometheus" rewrites a text exposition file.
+        :param export_interval: Minimum seconds between two exports from maybe_export.
+        """
+        self.export_path = export_path
+        self.export_format = export_format
+        self.export_interval = export_interval
+        self.prefix = prefix
+        self.timings = {}
+        self.counters = {}
+        self.values = {}
+        self.started = time.time()
+        self.last_export = time.perf_counter()
+        # Solvers of several threads may share one Metrics, e.g. the turns of concurrent_runner.py
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def timer(self, name):
+        """
+        Times the enclosed block as one sample of the phase `name`.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self.lock:
+                stat = self.timings.get(name)
+                if stat is None:
+                    stat = self.timings[name] = Stat()
+                stat.add(elapsed)
+
+    def count(self, name, amount=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def observe(self, name, value):
+        with self.lock:
+            stat = self.values.get(name)
+            if stat is None:
+                stat = self.values[name] = Stat()
+            stat.add(value)
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                "time": time.time(),
+                "uptime_seconds": time.time() - self.started,
+                "timings": {name: stat.as_dict() for name, stat in self.timings.items()},
+                "counters": dict(self.counters),
+                "values": {name: stat.as_dict() for name, stat in self.values.items()},
+            }
+
+    def maybe_export(self):
+        """
+        Exports when export_interval seconds passed since the last export.
+        """
+        if self.export_path and time.perf_counter() - self.last_export >= self.export_interval:
+            self.export()
+
+    def export(self):
+        if not self.export_path:
+            return
+        self.last_export = time.perf_counter()
+        if self.export_format == "prometheus":
+            tmp_path = f"{self.export_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as file:
+                file.write(self.prometheus_text())
+            os.replace(tmp_path, self.export_path)
+        else:
+            with open(self.export_path, 'a') as file:
+                file.write(json.dumps(self.snapshot()) + "\n")
+
+    def prometheus_text(self):
+        """
+        Formats the metrics in the Prometheus text exposition format.
+        """
+        with self.lock:
+            p = self.prefix
+            lines = [f"# TYPE {p}_phase_seconds summary"]
+            for name, stat in sorted(self.timings.items()):
+                lines.append(f'{p}_phase_seconds_sum{{phase="{name}"}} {stat.total}')
+                lines.append(f'{p}_phase_seconds_count{{phase="{name}"}} {stat.count}')
+            lines.append(f"# TYPE {p}_phase_max_seconds gauge")
+            for name, stat in sorted(self.timings.items()):
+                lines.append(f'{p}_phase_max_seconds{{phase="{name}"}} {stat.max}')
+            lines.append(f"# TYPE {p}_events_total counter")
+            for name, value in sorted(self.counters.items()):
+                lines.append(f'{p}_events_total{{event="{name}"}} {value}')
+            lines.append(f"# TYPE {p}_observed summary")
+            for name, stat in sorted(self.values.items()):
+                lines.append(f'{p}_observed_sum{{name="{name}"}} {stat.total}')
+                lines.append(f'{p}_observed_count{{name="{name}"}} {stat.count}')
+        return "\n".join(lines) + "\n"
+
+
+class NullMetrics:
+    """
+    Disabled metrics: every call is a no-op.
+    """
+    enabled = False
+    _null_timer = nullcontext()
+
+    def timer(self, name):
+        return self._null_timer
+
+    def count(self, name, amount=1):
+        pass
+
+    def observe(self, name, value):
+        pass
+
+    def maybe_export(self):
+        pass
+
+    def export(self):
+        pass
+
+
+NULL_METRICS = NullMetrics()
+
+
+def timed(name):
+    """
+    Method decorator timing every call as one sample of the phase `name` in the instance's metrics.
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.metrics.timer(name):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def profile_game(solver, game, output_path=None, top=25):
+    """
+    Plays one game under cProfile.
+    :param output_path: Where to dump the raw pstats data, the top entries are printed when None.
+    :return: pstats.Stats of the game.
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        solver.solve(game)
+    finally:
+        profiler.disable()
+    stats = pstats.Stats(profiler)
+    if output_path:
+        stats.dump_stats(output_path)
+    else:
+        stats.sort_stats("cumulative").print_stats(top)
+    return stats
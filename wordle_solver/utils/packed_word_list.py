@@ -0,0 +1,188 @@
+"""
+Packed binary word list format.
+Words are stored as fixed length rows of letter indices (A = 0 ... Z = 25) behind a small header, so a list
+can be memory-mapped without parsing a text file:
+
+    magic b"WLPK", version u8, word length u8, reserved u16, word count u64, sha256 of the text file (32 bytes)
+
+The packed file sits next to its text file with a .wlp extension and is regenerated when the sha256 of the text file
+no longer matches the header, whatever the file times say.
+
+Usage:
+    python wordle_solver/utils/packed_word_list.py wordle_solver/utils/self_creating_list.txt
+"""
+
+import hashlib
+import os
+import struct
+import sys
+
+import numpy as np
+
+MAGIC = b"WLPK"
+VERSION = 2
+HEADER = struct.Struct("<4sBBHQ32s")
+# Rows decoded at once when iterating over a packed list
+DECODE_ROWS = 1 << 16
+
+
+def packed_path_for(text_path):
+    return os.path.splitext(text_path)[0] + ".wlp"
+
+
+def text_digest(text_path) -> bytes:
+    """
+    sha256 of the bytes of a text word list, as stored in the header of its packed file.
+    """
+    digest = hashlib.sha256()
+    with open(text_path, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.digest()
+
+
+def pack_word_list(text_path, packed_path=None):
+    """
+    Converts a text word list (one word per line) to the packed format.
+    Lines that are empty, not alphabetic or of a different length than the first word are skipped.
+    :return: Path of the packed file.
+    """
+    packed_path = packed_path or packed_path_for(text_path)
+    with open(text_path, 'rb') as file:
+        data = file.read()
+    words = [line.strip().upper() for line in data.decode("utf-8", errors="replace").splitlines()]
+    words = [word for word in words if word.isalpha() and word.isascii()]
+    word_length = len(words[0]) if words else 5
+    words = [word for word in words if len(word) == word_length]
+    with PackedWordListWriter(packed_path, word_length) as writer:
+        writer.write(words)
+        writer.text_digest = hashlib.sha256(data).digest()
+    return packed_path
+
+
+class PackedWordListWriter:
+    """
+    Streams words of one length into a packed file. The header is filled in on close, when the word count
+    is known, and the file only replaces packed_path once complete.
+    The writer of the text file sets text_digest (see text_digest()) before closing.
+    """
+    def __init__(self, packed_path, word_length):
+        self.packed_path = packed_path
+        self.word_length = word_length
+        self.count = 0
+        self.text_digest = bytes(32)
+        self.tmp_path = f"{packed_path}.{os.getpid()}.tmp"
+        self.file = open(self.tmp_path, 'wb')
+        self.file.write(bytes(HEADER.size))
+
+    def write(self, words):
+        """
+        Appends a batch of alphabetic words.
+        """
+        content = "".join(words).upper().encode("ascii")
+        self.file.write((np.frombuffer(content, dtype=np.uint8) - ord("A")).tobytes())
+        self.count += len(words)
+
+    def close(self):
+        self.file.seek(0)
+        self.file.write(HEADER.pack(MAGIC, VERSION, self.word_length, 0, self.count, self.text_digest))
+        self.file.close()
+        os.replace(self.tmp_path, self.packed_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.file.close()
+            os.remove(self.tmp_path)
+
+
+def read_header(path):
+    """
+    :return: The unpacked header of a packed file, None when the file is missing or not of the current version.
+    """
+    try:
+        with open(path, 'rb') as file:
+            header = HEADER.unpack(file.read(HEADER.size))
+    except (OSError, struct.error):
+        return None
+    magic, version = header[:2]
+    return header if magic == MAGIC and version == VERSION else None
+
+
+class PackedWordList:
+    """
+    Memory-mapped packed word list. `letters` is a read-only (count, word_length) uint8 view of the file.
+    Words are decoded one at a time by indexing (or a block at a time when iterating), the list is never
+    turned into strings as a whole.
+    """
+    def __init__(self, path, text_path=None):
+        """
+        :param text_path: The text word list the file was packed from, when known.
+        """
+        self.path = path
+        self.text_path = text_path
+        header = read_header(path)
+        if header is None:
+            raise ValueError(f"{path} is not a packed word list of version {VERSION}.")
+        _, _, self.word_length, _, self.count, self.text_digest = header
+        if self.count:
+            self.letters = np.memmap(path, dtype=np.uint8, mode='r', offset=HEADER.size, shape=(self.count, self.word_length))
+        else:
+            self.letters = np.zeros((0, self.word_length), dtype=np.uint8)
+        self.found = {}
+
+    def decode(self, rows) -> list:
+        """
+        Decodes a (n, word_length) block of letter rows to strings.
+        """
+        text = (np.asarray(rows) + ord("A")).astype(np.uint8).tobytes().decode("ascii")
+        length = self.word_length
+        return [text[i:i + length] for i in range(0, len(text), length)]
+
+    def __getitem__(self, index) -> str:
+        return self.decode(self.letters[index][None])[0]
+
+    def __iter__(self):
+        for start in range(0, self.count, DECODE_ROWS):
+            yield from self.decode(self.letters[start:start + DECODE_ROWS])
+
+    def __len__(self):
+        return self.count
+
+    def find(self, word):
+        """
+        Index of the first occurrence of a word with one vectorized comparison, None when it is not in the list.
+        Results are cached, the preset openers are looked up every game.
+        """
+        word = word.upper()
+        if word in self.found:
+            return self.found[word]
+        index = None
+        if len(word) == self.word_length and word.isascii() and word.isalpha():
+            letters = np.frombuffer(word.encode("ascii"), dtype=np.uint8) - ord("A")
+            matches = np.flatnonzero((self.letters == letters).all(axis=1))
+            index = int(matches[0]) if len(matches) else None
+        self.found[word] = index
+        return index
+
+
+def load_packed_word_list(text_path) -> PackedWordList:
+    """
+    Loads the packed version of a text word list, (re)packing it when missing, of an older version or packed from
+    different text than the current file.
+    """
+    packed_path = packed_path_for(text_path)
+    header = read_header(packed_path)
+    if header is None or header[5] != text_digest(text_path):
+        pack_word_list(text_path, packed_path)
+    return PackedWordList(packed_path, text_path)
+
+
+if __name__ == "__main__":
+    for path in sys.argv[1:]:
+        packed = PackedWordList(pack_word_list(path))
+        print(f"Packed {packed.count} words of length {packed.word_length} to {packed.path}")
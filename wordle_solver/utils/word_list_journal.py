@@ -0,0 +1,161 @@
+"""
+Append-only learning journal for word list files.
+Learned additions and removals are appended as "+word" / "-word" lines next to the word list and kept in an
+in-memory set, so learning a word is O(1). The journal is folded into the word list file periodically and on
+close by writing a temporary file and renaming it over the original, so a crash never leaves a half written list.
+Appends and compactions take a shared / exclusive file lock so several solver processes can learn into the same list.
+Answers revealed by lost games are also appended to a separate .answers file that is never compacted, they are
+known real answers and get a higher prior (see solvers.priors).
+"""
+
+import os
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, single process use only
+    fcntl = None
+
+
+def answers_path_for(word_list_path):
+    return word_list_path + ".answers"
+
+
+def read_learned_answers(word_list_path) -> set:
+    """
+    Reads the answers learned for a word list, lower case.
+    """
+    path = answers_path_for(word_list_path)
+    if not os.path.exists(path):
+        return set()
+    with open(path, 'r') as file:
+        return set(line.strip().lower() for line in file if line.strip())
+
+
+class WordListJournal:
+    def __init__(self, word_list_path, journal_path=None, compact_every=100):
+        """
+        :param word_list_path: Word list file to learn into.
+        :param journal_path: Journal file, defaults to the word list path with a .journal suffix.
+        :param compact_every: Compact after this many events written by this process.
+        """
+        self.word_list_path = word_list_path
+        self.journal_path = journal_path or word_list_path + ".journal"
+        self.answers_path = answers_path_for(word_list_path)
+        self.answers = read_learned_answers(word_list_path)
+        self.lock_path = word_list_path + ".lock"
+        self.compact_every = compact_every
+        self.pending_events = 0
+        self.journal_fd = None
+        self.compact()
+
+    def _lock(self, exclusive):
+        lock_fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT)
+        if fcntl is not None:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        return lock_fd
+
+    @staticmethod
+    def _unlock(lock_fd):
+        # Closing the descriptor releases the flock
+        os.close(lock_fd)
+
+    def _read_events(self):
+        """
+        Reads the complete events of the journal. A torn last line from a crash is ignored.
+        """
+        if not os.path.exists(self.journal_path):
+            return []
+        with open(self.journal_path, 'r') as file:
+            lines = file.readlines()
+        return [(line[0], line[1:-1]) for line in lines if line.endswith('\n') and line[:1] in ('+', '-') and len(line) > 2]
+
+    def compact(self):
+        """
+        Replays every journal event (from all processes) into the word list file and empties the journal.
+        """
+        lock_fd = self._lock(exclusive=True)
+        try:
+            with open(self.word_list_path, 'r') as file:
+                words = [line.strip().lower() for line in file if line.strip()]
+            events = self._read_events()
+            ordered = dict.fromkeys(words)
+            for action, word in events:
+                if action == '+':
+                    ordered[word] = None
+                else:
+                    ordered.pop(word, None)
+            if events:
+                tmp_path = f"{self.word_list_path}.{os.getpid()}.tmp"
+                with open(tmp_path, 'w') as file:
+                    file.writelines(word + '\n' for word in ordered)
+                    file.flush()
+                    os.fsync(file.fileno())
+                os.replace(tmp_path, self.word_list_path)
+                with open(self.journal_path, 'w'):
+                    pass
+            self.words = set(ordered)
+            self.pending_events = 0
+        finally:
+            self._unlock(lock_fd)
+
+    def _append(self, action, word):
+        if self.journal_fd is None:
+            self.journal_fd = os.open(self.journal_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT)
+        lock_fd = self._lock(exclusive=False)
+        try:
+            # A single O_APPEND write of one short line is not interleaved with other processes
+            os.write(self.journal_fd, f"{action}{word}\n".encode("ascii"))
+        finally:
+            self._unlock(lock_fd)
+        self.pending_events += 1
+        if self.pending_events >= self.compact_every:
+            self.compact()
+
+    def add(self, word) -> bool:
+        """
+        Learns a word. :return: False if the word was already in the list.
+        """
+        word = word.lower()
+        if word in self.words:
+            return False
+        self.words.add(word)
+        self._append('+', word)
+        return True
+
+    def remove(self, word) -> bool:
+        """
+        Forgets a word. :return: False if the word was not in the list.
+        """
+        word = word.lower()
+        if word not in self.words:
+            return False
+        self.words.discard(word)
+        self._append('-', word)
+        return True
+
+    def add_answer(self, word) -> bool:
+        """
+        Records a word revealed as the answer of a game and learns it.
+        :return: False if the answer was already recorded.
+        """
+        word = word.lower()
+        self.add(word)
+        if word in self.answers:
+            return False
+        self.answers.add(word)
+        lock_fd = self._lock(exclusive=False)
+        try:
+            with open(self.answers_path, 'a') as file:
+                file.write(word + '\n')
+        finally:
+            self._unlock(lock_fd)
+        return True
+
+    def close(self):
+        """
+        Compacts the journal into the word list file.
+        """
+        if self.journal_fd is not None:
+            os.close(self.journal_fd)
+            self.journal_fd = None
+        self.compact()